@@ -0,0 +1,43 @@
+"""
+Shared pytest configuration
+
+Pass --fixture-timings to report cumulative setup time per fixture.
+"""
+
+import time
+from collections import defaultdict
+import pytest
+
+_elapsed = defaultdict(float)
+
+
+def pytest_addoption(parser):
+    """Register command line options"""
+    parser.addoption(
+        '--fixture-timings',
+        action='store_true',
+        default=False,
+        help='report cumulative setup time for each fixture'
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Time fixture setup when --fixture-timings is given"""
+    if not request.config.getoption('fixture_timings'):
+        yield
+        return
+
+    start = time.perf_counter()
+    yield
+    _elapsed[fixturedef.argname] += time.perf_counter() - start
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print fixture timings, slowest first"""
+    if not config.getoption('fixture_timings') or not _elapsed:
+        return
+
+    terminalreporter.write_sep('=', 'fixture setup timings')
+    for name, seconds in sorted(_elapsed.items(), key=lambda item: item[1], reverse=True):
+        terminalreporter.write_line(f"{seconds * 1000:9.2f} ms  {name}")
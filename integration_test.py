@@ -1,43 +1,48 @@
 """
 Integration test to verify all components work together
+
+Run with pytest (tests are distributed across cores by pytest-xdist):
+    pytest -n auto --dist=loadfile integration_test.py
 """
 
 import sys
+import pytest
+from unittest.mock import MagicMock
 from news_api import NewsAPIClient
 from utils import ArticleFormatter, Paginator, FavoritesManager
 from ui import NewsUI
 from main import NewsApp
 
 
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """NewsApp whose favorites file lives in a temporary directory"""
+    # NewsApp opens ./favorites.jsonl and flushes it at exit; keep the
+    # developer's real favorites out of the test run, and give the app an
+    # absolute path so a late atexit flush can't land back in the checkout
+    monkeypatch.chdir(tmp_path)
+    news_app = NewsApp()
+    news_app.favorites = FavoritesManager(str(tmp_path / 'favorites.jsonl'))
+    return news_app
+
+
 def test_imports():
     """Test all imports are successful"""
-    print("Testing imports...")
-    print("  news_api module: OK")
-    print("  utils module: OK")
-    print("  ui module: OK")
-    print("  main module: OK")
-    return True
+    assert NewsAPIClient and ArticleFormatter and NewsUI and NewsApp
 
 
 def test_api_client_creation():
     """Test API client can be created"""
-    print("\nTesting API client creation...")
     try:
         # This will fail if no API key is set, which is expected
         client = NewsAPIClient()
-        print("  API client created: OK")
         client.close()
-        return True
     except ValueError as e:
-        if "NEWS_API_KEY" in str(e):
-            print(f"  API client validation: OK (API key required)")
-            return True
-        raise
+        assert "NEWS_API_KEY" in str(e)
 
 
 def test_formatter():
     """Test article formatter"""
-    print("\nTesting article formatter...")
     test_article = {
         'title': 'Test Article',
         'source': {'name': 'Test Source'},
@@ -51,13 +56,10 @@ def test_formatter():
     formatted = ArticleFormatter.format_article(test_article, 1)
     assert formatted['title'] == 'Test Article'
     assert formatted['source'] == 'Test Source'
-    print("  Article formatting: OK")
-    return True
 
 
 def test_paginator():
     """Test paginator"""
-    print("\nTesting paginator...")
     items = list(range(25))
     paginator = Paginator(items, page_size=10)
 
@@ -65,103 +67,96 @@ def test_paginator():
     page_items, page_info = paginator.get_page(1)
     assert len(page_items) == 10
     assert page_info['has_next'] is True
-    print("  Pagination: OK")
-    return True
 
 
-def test_favorites_manager():
+def test_favorites_manager(tmp_path):
     """Test favorites manager"""
-    print("\nTesting favorites manager...")
-    import tempfile
-    import os
+    manager = FavoritesManager(str(tmp_path / 'favorites.jsonl'))
+    assert manager.get_count() == 0
 
-    temp_file = tempfile.mktemp(suffix='.json')
-    try:
-        manager = FavoritesManager(temp_file)
-        assert manager.get_count() == 0
-
-        test_article = {
-            'title': 'Test',
-            'source': {'name': 'Source'},
-            'url': 'https://test.com'
-        }
+    test_article = {
+        'title': 'Test',
+        'source': {'name': 'Source'},
+        'url': 'https://test.com'
+    }
 
-        manager.add_favorite(test_article)
-        assert manager.get_count() == 1
-        assert manager.is_favorite('https://test.com')
-        print("  Favorites management: OK")
-        return True
-    finally:
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+    manager.add_favorite(test_article)
+    assert manager.get_count() == 1
+    assert manager.is_favorite('https://test.com')
 
 
 def test_ui_components():
     """Test UI components"""
-    print("\nTesting UI components...")
     ui = NewsUI()
 
     # Test color scheme
     assert 'primary' in NewsUI.COLORS
     assert 'success' in NewsUI.COLORS
 
-    print("  UI components: OK")
-    return True
-
 
-def test_app_creation():
+def test_app_creation(app):
     """Test main app can be created"""
-    print("\nTesting app creation...")
-    app = NewsApp()
     assert app.favorites is not None
     assert app.ui is not None
-    print("  App creation: OK")
-    return True
-
-
-def run_all_tests():
-    """Run all integration tests"""
-    print("=" * 60)
-    print("INTEGRATION TEST SUITE")
-    print("=" * 60)
-
-    tests = [
-        test_imports,
-        test_api_client_creation,
-        test_formatter,
-        test_paginator,
-        test_favorites_manager,
-        test_ui_components,
-        test_app_creation
+
+
+def test_app_resumes_pagination(app):
+    """Test re-entering the same results resumes on the same page"""
+    articles = [
+        ArticleFormatter.format_article({'title': f'Article {i}', 'url': f'https://test.com/{i}'}, i)
+        for i in range(1, 26)
     ]
 
-    passed = 0
-    failed = 0
-
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            failed += 1
-
-    print("\n" + "=" * 60)
-    print(f"RESULTS: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    if failed == 0:
-        print("\nAll integration tests passed!")
-        print("The application is ready to use.")
-        print("\nTo run the application:")
-        print("  1. Add your News API key to .env file")
-        print("  2. Run: python main.py")
-        return True
-    else:
-        print("\nSome tests failed. Please check the errors above.")
-        return False
+    paginator = app._get_paginator(articles, "Top Headlines")
+    paginator.next_page()
+
+    rebuilt = [dict(article) for article in articles]
+    assert app._get_paginator(rebuilt, "Top Headlines") is paginator
+    assert paginator.current_page == 2
+    assert app._get_paginator(rebuilt, "Technology News") is not paginator
+
+
+def test_app_repaints_after_actions_below_frame(app):
+    """Test view, save and open force a full repaint of the next page"""
+    app.ui = MagicMock(spec=NewsUI)
+    app.ui.show_pagination_menu.side_effect = ['v', 's', 'o', 'b']
+    app.ui.get_number_input.return_value = None
+
+    articles = ArticleFormatter.format_articles([{'title': 'Article', 'url': 'https://test.com'}])
+    app._display_articles_paginated(articles, "Top Headlines")
+
+    # Each prompt is cancelled, so nothing cleared the screen in between
+    assert app.ui.reset_frame.call_count == 3
+    app.ui.clear.assert_called_once()
+
+
+def test_app_save_written_immediately(app, tmp_path):
+    """Test an interactive save reaches the favorites file before exit"""
+    app.ui = MagicMock(spec=NewsUI)
+    app.ui.get_number_input.return_value = 1
+
+    articles = ArticleFormatter.format_articles([{'title': 'Article', 'url': 'https://test.com'}])
+    app._save_article_to_favorites(articles)
+
+    app.ui.show_success.assert_called_once()
+    assert FavoritesManager(str(tmp_path / 'favorites.jsonl')).is_favorite('https://test.com')
+
+
+def test_browse_by_source_reports_headlines_failure(app, monkeypatch):
+    """Test a failed headlines fetch isn't reported as a sources failure"""
+    def fail(**kwargs):
+        raise ValueError("Rate limit exceeded")
+
+    app.api_client = NewsAPIClient(api_key='test_key_12345678901234567890')
+    monkeypatch.setattr(app.api_client, 'get_sources', lambda **kwargs: {'sources': [{'name': 'BBC News'}]})
+    monkeypatch.setattr(app.api_client, 'get_top_headlines', fail)
+    app.ui = MagicMock(spec=NewsUI)
+
+    app.browse_by_source()
+
+    app.ui.show_error.assert_called_once_with("Failed to fetch headlines: Rate limit exceeded")
+    app.api_client.close()
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main(['-n', 'auto', __file__]))
@@ -4,7 +4,7 @@ A sleek terminal-based news aggregator using News API
 """
 
 import sys
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from news_api import NewsAPIClient
 from utils import ArticleFormatter, Paginator, FavoritesManager
 from ui import NewsUI
@@ -13,12 +13,16 @@ from ui import NewsUI
 class NewsApp:
     """Main application class for News Dashboard"""
 
+    # Result sets whose pagination state is kept for Back → re-enter
+    PAGINATOR_CACHE_SIZE = 8
+
     def __init__(self):
         """Initialize the application"""
         self.api_client: Optional[NewsAPIClient] = None
         self.favorites = FavoritesManager()
         self.ui = NewsUI()
         self.running = False
+        self._paginators: Dict[Tuple, Paginator] = {}
 
     def initialize(self) -> bool:
         """
@@ -28,7 +32,7 @@ class NewsApp:
             True if successful, False otherwise
         """
         try:
-            self.api_client = NewsAPIClient()
+            self.api_client = NewsAPIClient.get_instance()
             return True
         except ValueError as e:
             self.ui.show_error(str(e))
@@ -83,24 +87,30 @@ class NewsApp:
             with self.ui.show_loading("Fetching top headlines"):
                 response = self.api_client.get_top_headlines(page_size=100)
 
-            articles = response.get('articles', [])
+            self._show_headlines(response)
 
-            if not articles:
-                self.ui.show_info("No headlines available at the moment")
-                self.ui.press_enter_to_continue()
-                return
+        except Exception as e:
+            self.ui.show_error(f"Failed to fetch headlines: {e}")
+            self.ui.press_enter_to_continue()
 
-            # Format articles
-            formatted_articles = [
-                ArticleFormatter.format_article(article, idx + 1)
-                for idx, article in enumerate(articles)
-            ]
+    def _show_headlines(self, response: Dict):
+        """
+        Display a top-headlines response
 
-            self._display_articles_paginated(formatted_articles, "Top Headlines")
+        Args:
+            response: Response from the top-headlines endpoint
+        """
+        articles = response.get('articles', [])
 
-        except Exception as e:
-            self.ui.show_error(f"Failed to fetch headlines: {e}")
+        if not articles:
+            self.ui.show_info("No headlines available at the moment")
             self.ui.press_enter_to_continue()
+            return
+
+        # Format articles
+        formatted_articles = ArticleFormatter.format_articles(articles)
+
+        self._display_articles_paginated(formatted_articles, "Top Headlines")
 
     def search_news(self):
         """Search for news"""
@@ -126,17 +136,13 @@ class NewsApp:
                 return
 
             # Format articles and highlight keywords
-            formatted_articles = []
-            keywords = query.split()
-
-            for idx, article in enumerate(articles):
-                formatted = ArticleFormatter.format_article(article, idx + 1)
-                # Highlight keywords in title
-                formatted['title'] = ArticleFormatter.highlight_keywords(
-                    formatted['title'],
-                    keywords
-                )
-                formatted_articles.append(formatted)
+            formatted_articles = ArticleFormatter.format_articles(articles)
+            pattern = ArticleFormatter.compile_keywords(query.split())
+
+            if pattern:
+                highlight = ArticleFormatter.highlight_keywords
+                for formatted in formatted_articles:
+                    formatted['title'] = highlight(formatted['title'], pattern)
 
             self._display_articles_paginated(formatted_articles, f"Search Results: '{query}'")
 
@@ -168,10 +174,7 @@ class NewsApp:
                 self.ui.press_enter_to_continue()
                 return
 
-            formatted_articles = [
-                ArticleFormatter.format_article(article, idx + 1)
-                for idx, article in enumerate(articles)
-            ]
+            formatted_articles = ArticleFormatter.format_articles(articles)
 
             self._display_articles_paginated(formatted_articles, f"{category.title()} News")
 
@@ -185,9 +188,15 @@ class NewsApp:
         self.ui.show_header()
 
         try:
-            # Get available sources
+            # Fetch sources and headlines in parallel
             with self.ui.show_loading("Fetching available sources"):
-                response = self.api_client.get_sources()
+                response, headlines = self.api_client.get_many([
+                    (self.api_client.get_sources, {}),
+                    (self.api_client.get_top_headlines, {'page_size': 100}),
+                ], return_exceptions=True)
+
+            if isinstance(response, Exception):
+                raise response
 
             sources = response.get('sources', [])
 
@@ -203,7 +212,13 @@ class NewsApp:
             # For now, just show top headlines (source filtering requires specific source IDs)
             self.ui.show_info("Showing top headlines from all sources")
             self.ui.press_enter_to_continue()
-            self.view_top_headlines()
+
+            if isinstance(headlines, Exception):
+                self.ui.show_error(f"Failed to fetch headlines: {headlines}")
+                self.ui.press_enter_to_continue()
+                return
+
+            self._show_headlines(headlines)
 
         except Exception as e:
             self.ui.show_error(f"Failed to fetch sources: {e}")
@@ -223,17 +238,18 @@ class NewsApp:
             return
 
         # Format favorites
+        format_date = ArticleFormatter.format_date
         formatted_articles = [
             {
-                'index': idx + 1,
+                'index': idx,
                 'title': fav['title'],
                 'source': fav['source'],
                 'description': fav.get('description', ''),
                 'url': fav['url'],
-                'published': ArticleFormatter.format_date(fav.get('published', '')),
+                'published': format_date(fav.get('published', '')),
                 'author': 'Unknown'
             }
-            for idx, fav in enumerate(favorites)
+            for idx, fav in enumerate(favorites, 1)
         ]
 
         self._display_articles_paginated(formatted_articles, "My Favorites", allow_save=False)
@@ -252,16 +268,16 @@ class NewsApp:
             title: Display title
             allow_save: Whether to allow saving to favorites
         """
-        paginator = Paginator(articles, page_size=10)
-        current_articles = articles
+        paginator = self._get_paginator(articles, title)
+        self.ui.clear()
 
         while True:
-            self.ui.clear()
-            self.ui.show_header()
-
             page_articles, page_info = paginator.get_page(paginator.current_page)
 
-            self.ui.show_articles_table(page_articles, page_info)
+            # Repaint only the rows that differ from the previous page
+            with self.ui.frame(self.ui.pagination_menu_rows(page_info)):
+                self.ui.show_header()
+                self.ui.show_articles_table(page_articles, page_info)
 
             action = self.ui.show_pagination_menu(page_info)
 
@@ -278,6 +294,36 @@ class NewsApp:
             elif action == 'b':
                 break
 
+            if action not in ('n', 'p'):
+                # Prompts and messages below the frame may have scrolled it
+                self.ui.reset_frame()
+
+    def _get_paginator(self, articles: List[Dict], title: str) -> Paginator:
+        """
+        Get the paginator for a result set, reusing it if seen recently
+
+        Re-entering the same results resumes on the page the user left.
+
+        Args:
+            articles: List of formatted articles
+            title: Display title
+
+        Returns:
+            Paginator for the articles
+        """
+        key = (title, tuple((article['url'], article['title']) for article in articles))
+
+        paginator = self._paginators.pop(key, None)
+        if paginator is None:
+            paginator = Paginator(articles, page_size=10)
+
+        # Re-insert so the dict stays ordered from least to most recently used
+        self._paginators[key] = paginator
+        while len(self._paginators) > self.PAGINATOR_CACHE_SIZE:
+            del self._paginators[next(iter(self._paginators))]
+
+        return paginator
+
     def _view_article_detail(self, articles: List[Dict]):
         """View detailed article"""
         article_num = self.ui.get_number_input(
@@ -319,10 +365,13 @@ class NewsApp:
             'publishedAt': article.get('published', '')
         }
 
-        if self.favorites.add_favorite(article_to_save):
+        if not self.favorites.add_favorite(article_to_save):
+            self.ui.show_warning("Article already in favorites")
+        elif self.favorites.flush():
+            # Written now: atexit won't run if the terminal is closed or killed
             self.ui.show_success("Article saved to favorites!")
         else:
-            self.ui.show_warning("Article already in favorites")
+            self.ui.show_error("Failed to write favorites file")
 
         self.ui.press_enter_to_continue()
 
@@ -358,6 +407,7 @@ class NewsApp:
         self.ui.clear()
         self.ui.show_goodbye()
         self.running = False
+        self.favorites.flush()
 
         if self.api_client:
             self.api_client.close()
@@ -368,6 +418,7 @@ class NewsApp:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
+        self.favorites.flush()
         if self.api_client:
             self.api_client.close()
 
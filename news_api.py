@@ -4,17 +4,90 @@ Handles all interactions with the News API (newsapi.org)
 """
 
 import os
+import threading
+import time
 import requests
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the standard library parses bytes too
+    from json import loads as _json_loads
+
+_DOTENV_LOADED = False
+
+
+def _ensure_env():
+    """Load variables from .env once, on first client construction"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Return cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Dict):
+        """Store value, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared clients by API key, see NewsAPIClient.get_instance()
+_client_cache: Dict[str, 'NewsAPIClient'] = {}
 
-# Load environment variables
-load_dotenv()
 
 class NewsAPIClient:
     """Client for interacting with News API"""
 
     BASE_URL = "https://newsapi.org/v2"
+    MAX_WORKERS = 8
+    CACHE_SIZE = 128
+    CACHE_TTL = 300  # seconds
 
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -23,6 +96,8 @@ class NewsAPIClient:
         Args:
             api_key: API key for News API (optional, reads from .env if not provided)
         """
+        if not api_key:
+            _ensure_env()
         self.api_key = api_key or os.getenv('NEWS_API_KEY')
         if not self.api_key or self.api_key == 'your_api_key_here':
             raise ValueError(
@@ -37,10 +112,60 @@ class NewsAPIClient:
             'User-Agent': 'News-Dashboard/1.0'
         })
 
+        # Size the connection pool so concurrent fetches in get_many()
+        # don't queue up behind a single keep-alive connection
+        adapter = HTTPAdapter(pool_connections=self.MAX_WORKERS, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+
+        # Repeat navigation is served from memory and doesn't eat into
+        # the daily request quota
+        self._cache = _ResponseCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
+
+    @classmethod
+    def get_instance(cls, api_key: Optional[str] = None) -> 'NewsAPIClient':
+        """
+        Get the shared client for an API key, creating it on first use
+
+        Reusing the client keeps its pooled connections and response cache.
+
+        Args:
+            api_key: API key for News API (optional, reads from .env if not provided)
+
+        Returns:
+            Cached NewsAPIClient instance
+
+        Raises:
+            ValueError: If no valid API key is available
+        """
+        if not api_key:
+            _ensure_env()
+            api_key = os.getenv('NEWS_API_KEY')
+
+        client = _client_cache.get(api_key) if api_key else None
+        if client is None:
+            client = cls(api_key)
+            _client_cache[client.api_key] = client
+        return client
+
+    @classmethod
+    def invalidate(cls, api_key: Optional[str] = None):
+        """
+        Drop shared clients created by get_instance()
+
+        Args:
+            api_key: Only drop the client for this key (drops all if omitted)
+        """
+        if api_key is None:
+            _client_cache.clear()
+        else:
+            _client_cache.pop(api_key, None)
+
     def _make_request(self, endpoint: str, params: Dict) -> Dict:
         """
         Make HTTP request to News API
 
+        Successful responses are cached for CACHE_TTL seconds.
+
         Args:
             endpoint: API endpoint (e.g., 'top-headlines', 'everything')
             params: Query parameters
@@ -52,12 +177,17 @@ class NewsAPIClient:
             requests.exceptions.RequestException: On network errors
             ValueError: On API errors
         """
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
 
             # Check API-specific errors
             if data.get('status') == 'error':
@@ -65,6 +195,7 @@ class NewsAPIClient:
                 error_message = data.get('message', 'Unknown error')
                 raise ValueError(f"API Error [{error_code}]: {error_message}")
 
+            self._cache.set(cache_key, data)
             return data
 
         except requests.exceptions.Timeout:
@@ -79,6 +210,37 @@ class NewsAPIClient:
             else:
                 raise requests.exceptions.RequestException(f"HTTP Error: {e}")
 
+    def get_many(
+        self,
+        calls: List[Tuple[Callable[..., Dict], Dict]],
+        return_exceptions: bool = False
+    ) -> List:
+        """
+        Run several of this client's request methods concurrently
+
+        Args:
+            calls: List of (method, kwargs) tuples, e.g.
+                (client.get_top_headlines, {'category': 'science'})
+            return_exceptions: Return a failed call's exception in its
+                place instead of raising it
+
+        Returns:
+            Responses (or exceptions) in the same order as calls
+
+        Raises:
+            The error of the earliest failed call, in call order, unless
+            return_exceptions is set
+        """
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(calls))) as executor:
+            futures = [executor.submit(method, **kwargs) for method, kwargs in calls]
+
+        if not return_exceptions:
+            return [future.result() for future in futures]
+        return [future.exception() or future.result() for future in futures]
+
     def get_top_headlines(
         self,
         country: str = 'us',
@@ -212,7 +374,10 @@ class NewsAPIClient:
         return self._make_request('top-headlines', params)
 
     def close(self):
-        """Close the HTTP session"""
+        """Close the HTTP session and drop cached responses"""
+        if _client_cache.get(self.api_key) is self:
+            del _client_cache[self.api_key]
+        self._cache.clear()
         self.session.close()
 
     def __enter__(self):
@@ -0,0 +1,119 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import json
+import pytest
+import requests
+from types import MappingProxyType
+from unittest.mock import Mock, patch
+import news_api
+import ui
+from news_api import NewsAPIClient
+
+
+@pytest.fixture
+def fresh_response():
+    """Factory for requests.Response mocks carrying a JSON payload"""
+    def make(payload=None):
+        response = Mock(spec=requests.Response)
+        response.content = json.dumps(payload or {}).encode()
+        return response
+    return make
+
+
+# Captured before any patching: news_api.requests.Session is requests.Session
+_SESSION_SPEC = requests.Session
+
+
+def _session_mock():
+    """Build a requests.Session stand-in with a real headers dict"""
+    session = Mock(spec=_SESSION_SPEC)
+    session.headers = {}
+    return session
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_requests_session():
+    """Give every NewsAPIClient a mocked session instead of a real one"""
+    with patch.object(news_api.requests, 'Session', side_effect=_session_mock):
+        yield
+
+
+@pytest.fixture
+def mock_session(fresh_response):
+    """Patch requests.Session in news_api and return the session instance"""
+    session = _session_mock()
+    session.get.return_value = fresh_response()
+    with patch.object(news_api.requests, 'Session', return_value=session):
+        yield session
+
+
+@pytest.fixture
+def mock_ok_session(mock_session, fresh_response):
+    """Session whose GET returns a successful, empty response"""
+    mock_session.get.return_value = fresh_response({'status': 'ok', 'articles': []})
+    return mock_session
+
+
+TEST_API_KEY = 'test_key_12345678901234567890'
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _set_news_api_key():
+    """Set a well-formed NEWS_API_KEY once per test module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('NEWS_API_KEY', TEST_API_KEY)
+        yield
+
+
+@pytest.fixture
+def client(mock_ok_session):
+    """NewsAPIClient backed by the mocked session"""
+    news_client = NewsAPIClient()
+    yield news_client
+    news_client.close()
+
+
+@pytest.fixture
+def prompt_stub(monkeypatch):
+    """Replace Prompt.ask in ui; set return_value or side_effect per test"""
+    stub = Mock()
+    monkeypatch.setattr(ui.Prompt, 'ask', stub)
+    return stub
+
+
+@pytest.fixture
+def confirm_stub(monkeypatch):
+    """Replace Confirm.ask in ui; set return_value per test"""
+    stub = Mock()
+    monkeypatch.setattr(ui.Confirm, 'ask', stub)
+    return stub
+
+
+@pytest.fixture(scope="module")
+def sample_article():
+    """Read-only formatted article shared by a test module"""
+    return MappingProxyType({
+        'index': 1,
+        'title': 'Test Article',
+        'source': 'Test Source',
+        'author': 'John Doe',
+        'published': '2024-01-15 10:30',
+        'description': 'Test description',
+        'url': 'https://test.com'
+    })
+
+
+@pytest.fixture(scope="module")
+def sample_page_info():
+    """Read-only page info for a single one-article page"""
+    return MappingProxyType({
+        'current_page': 1,
+        'total_pages': 1,
+        'start_index': 1,
+        'end_index': 1,
+        'total_items': 1,
+        'has_prev': False,
+        'has_next': False
+    })
@@ -2,171 +2,149 @@
 Unit tests for news_api module
 """
 
+import dotenv
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 import requests
+import news_api
 from news_api import NewsAPIClient, validate_api_key
 
 
 class TestNewsAPIClient:
     """Tests for NewsAPIClient class"""
 
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_api_key_12345678901234567890'})
     def test_init_with_env_key(self):
         """Test initialization with environment variable"""
         client = NewsAPIClient()
-        assert client.api_key == 'test_api_key_12345678901234567890'
+        assert client.api_key == 'test_key_12345678901234567890'
 
     def test_init_with_provided_key(self):
         """Test initialization with provided API key"""
         client = NewsAPIClient(api_key='provided_key_12345678901234567890')
         assert client.api_key == 'provided_key_12345678901234567890'
 
-    @patch.dict('os.environ', {}, clear=True)
-    def test_init_without_key_raises_error(self):
+    @patch.object(dotenv, 'load_dotenv')
+    @patch.object(news_api, '_DOTENV_LOADED', False)
+    def test_init_loads_dotenv_once(self, mock_load_dotenv):
+        """Test .env is loaded lazily on first construction only"""
+        NewsAPIClient()
+        NewsAPIClient()
+        mock_load_dotenv.assert_called_once()
+
+    def test_init_without_key_raises_error(self, monkeypatch):
         """Test initialization without API key raises ValueError"""
+        # Don't let a developer's .env supply the key on first construction
+        monkeypatch.setattr(news_api, '_DOTENV_LOADED', True)
+        monkeypatch.delenv('NEWS_API_KEY')
         with pytest.raises(ValueError, match="NEWS_API_KEY not found"):
             NewsAPIClient()
 
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'your_api_key_here'})
-    def test_init_with_placeholder_key_raises_error(self):
+    def test_init_with_placeholder_key_raises_error(self, monkeypatch):
         """Test initialization with placeholder key raises ValueError"""
+        monkeypatch.setenv('NEWS_API_KEY', 'your_api_key_here')
         with pytest.raises(ValueError, match="NEWS_API_KEY not found or invalid"):
             NewsAPIClient()
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_make_request_success(self, mock_session):
+    def test_make_request_success(self, client, mock_session, fresh_response):
         """Test successful API request"""
-        # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_session.get.return_value = fresh_response({
             'status': 'ok',
             'articles': [{'title': 'Test Article'}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        })
 
-        client = NewsAPIClient()
         result = client._make_request('top-headlines', {'country': 'us'})
 
         assert result['status'] == 'ok'
         assert len(result['articles']) == 1
         assert result['articles'][0]['title'] == 'Test Article'
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_make_request_api_error(self, mock_session):
-        """Test API error response"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'status': 'error',
-            'code': 'apiKeyInvalid',
-            'message': 'Your API key is invalid'
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
-
-        client = NewsAPIClient()
+    @pytest.mark.parametrize("payload", [
+        {'status': 'error', 'code': 'apiKeyInvalid', 'message': 'Your API key is invalid'},
+        {'status': 'error', 'code': 'rateLimited'},
+    ])
+    def test_make_request_api_error(self, client, mock_session, fresh_response, payload):
+        """Test API error responses"""
+        mock_session.get.return_value = fresh_response(payload)
 
         with pytest.raises(ValueError, match="API Error"):
             client._make_request('top-headlines', {})
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_make_request_timeout(self, mock_session):
-        """Test request timeout"""
-        mock_session_instance = Mock()
-        mock_session_instance.get.side_effect = requests.exceptions.Timeout()
-        mock_session.return_value = mock_session_instance
-
-        client = NewsAPIClient()
+    @pytest.mark.parametrize("side_effect,match", [
+        (requests.exceptions.Timeout(), "timed out"),
+        (requests.exceptions.ConnectionError(), "Connection error"),
+    ])
+    def test_make_request_network_errors(self, client, mock_session, side_effect, match):
+        """Test network failures are re-raised with a readable message"""
+        mock_session.get.side_effect = side_effect
 
-        with pytest.raises(requests.exceptions.RequestException, match="timed out"):
+        with pytest.raises(requests.exceptions.RequestException, match=match):
             client._make_request('top-headlines', {})
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_make_request_connection_error(self, mock_session):
-        """Test connection error"""
-        mock_session_instance = Mock()
-        mock_session_instance.get.side_effect = requests.exceptions.ConnectionError()
-        mock_session.return_value = mock_session_instance
+    def test_make_request_cached(self, client, mock_ok_session):
+        """Test repeated requests are served from the cache"""
+        first = client._make_request('top-headlines', {'country': 'us', 'page': 1})
+        second = client._make_request('top-headlines', {'page': 1, 'country': 'us'})
 
-        client = NewsAPIClient()
+        assert first is second
+        mock_ok_session.get.assert_called_once()
 
-        with pytest.raises(requests.exceptions.RequestException, match="Connection error"):
-            client._make_request('top-headlines', {})
+        client._make_request('top-headlines', {'country': 'gb', 'page': 1})
+        assert mock_ok_session.get.call_count == 2
+
+    @patch.object(news_api.time, 'monotonic')
+    def test_make_request_cache_expires(self, mock_monotonic, client, mock_ok_session):
+        """Test cached responses expire after the TTL"""
+        mock_monotonic.return_value = 1000.0
+        client._make_request('top-headlines', {})
+
+        mock_monotonic.return_value = 1000.0 + NewsAPIClient.CACHE_TTL + 1
+        client._make_request('top-headlines', {})
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_get_top_headlines_basic(self, mock_session):
+        assert mock_ok_session.get.call_count == 2
+
+    def test_make_request_error_not_cached(self, client, mock_session, fresh_response):
+        """Test API error responses are not cached"""
+        mock_session.get.return_value = fresh_response({'status': 'error', 'code': 'rateLimited'})
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="API Error"):
+                client._make_request('top-headlines', {})
+
+        assert mock_session.get.call_count == 2
+
+    def test_get_top_headlines_basic(self, mock_ok_session, fresh_response):
         """Test get_top_headlines with default parameters"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_ok_session.get.return_value = fresh_response({
             'status': 'ok',
             'totalResults': 1,
             'articles': [{'title': 'Headline'}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        })
 
         client = NewsAPIClient()
         result = client.get_top_headlines()
 
         assert result['status'] == 'ok'
         assert len(result['articles']) == 1
-        mock_session_instance.get.assert_called_once()
+        mock_ok_session.get.assert_called_once()
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_get_top_headlines_with_category(self, mock_session):
+    def test_get_top_headlines_with_category(self, client, mock_ok_session):
         """Test get_top_headlines with category filter"""
-        mock_response = Mock()
-        mock_response.json.return_value = {'status': 'ok', 'articles': []}
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
-
-        client = NewsAPIClient()
         client.get_top_headlines(category='technology')
 
-        call_args = mock_session_instance.get.call_args
+        call_args = mock_ok_session.get.call_args
         assert call_args[1]['params']['category'] == 'technology'
 
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_get_top_headlines_invalid_category(self):
+    def test_get_top_headlines_invalid_category(self, client):
         """Test get_top_headlines with invalid category"""
-        client = NewsAPIClient()
-
         with pytest.raises(ValueError, match="Invalid category"):
             client.get_top_headlines(category='invalid_category')
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_search_news_basic(self, mock_session):
+    def test_search_news_basic(self, mock_ok_session, fresh_response):
         """Test search_news with basic query"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_ok_session.get.return_value = fresh_response({
             'status': 'ok',
             'articles': [{'title': 'Search Result'}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        })
 
         client = NewsAPIClient()
         result = client.search_news('python')
@@ -174,28 +152,17 @@ class TestNewsAPIClient:
         assert result['status'] == 'ok'
         assert len(result['articles']) == 1
 
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_search_news_empty_query(self):
+    def test_search_news_empty_query(self, client):
         """Test search_news with empty query"""
-        client = NewsAPIClient()
-
         with pytest.raises(ValueError, match="Search query cannot be empty"):
             client.search_news('')
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_get_sources(self, mock_session):
+    def test_get_sources(self, mock_ok_session, fresh_response):
         """Test get_sources"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_ok_session.get.return_value = fresh_response({
             'status': 'ok',
             'sources': [{'id': 'bbc-news', 'name': 'BBC News'}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        })
 
         client = NewsAPIClient()
         result = client.get_sources()
@@ -203,84 +170,122 @@ class TestNewsAPIClient:
         assert result['status'] == 'ok'
         assert len(result['sources']) == 1
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_get_headlines_by_source(self, mock_session):
+    def test_get_headlines_by_source(self, mock_ok_session, fresh_response):
         """Test get_headlines_by_source"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_ok_session.get.return_value = fresh_response({
             'status': 'ok',
             'articles': [{'title': 'Source Article'}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        })
 
         client = NewsAPIClient()
         result = client.get_headlines_by_source(['bbc-news'])
 
         assert result['status'] == 'ok'
-        call_args = mock_session_instance.get.call_args
+        call_args = mock_ok_session.get.call_args
         assert 'bbc-news' in call_args[1]['params']['sources']
 
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
-    def test_get_headlines_by_source_empty_list(self):
+    def test_get_headlines_by_source_empty_list(self, client):
         """Test get_headlines_by_source with empty source list"""
-        client = NewsAPIClient()
-
         with pytest.raises(ValueError, match="At least one source"):
             client.get_headlines_by_source([])
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
+    def test_get_many_preserves_order(self, client, mock_session, fresh_response):
+        """Test get_many returns responses in call order"""
+        mock_session.get.side_effect = lambda url, params, timeout: fresh_response(
+            {'status': 'ok', 'endpoint': url.rsplit('/v2/', 1)[1], 'params': params}
+        )
+
+        results = client.get_many([
+            (client.get_sources, {}),
+            (client.get_top_headlines, {'page_size': 100}),
+        ])
+
+        assert [r['endpoint'] for r in results] == ['top-headlines/sources', 'top-headlines']
+        assert results[1]['params'] == {'country': 'us', 'page': 1, 'pageSize': 100}
+        assert mock_session.get.call_count == 2
+
+    def test_get_many_propagates_errors(self, client, mock_session):
+        """Test get_many raises if any request fails"""
+        mock_session.get.side_effect = requests.exceptions.Timeout()
+
+        with pytest.raises(requests.exceptions.RequestException, match="timed out"):
+            client.get_many([(client.get_top_headlines, {}), (client.search_news, {'query': 'python'})])
+
+    def test_get_many_raises_in_call_order(self, client):
+        """Test the earliest failed call's error is the one raised"""
+        with pytest.raises(ValueError, match="Search query cannot be empty"):
+            client.get_many([
+                (client.search_news, {'query': ''}),
+                (client.get_top_headlines, {'category': 'invalid_category'}),
+            ])
+
+    def test_get_many_return_exceptions(self, client):
+        """Test failed calls can be returned in place"""
+        sources, headlines = client.get_many([
+            (client.get_sources, {}),
+            (client.get_top_headlines, {'category': 'invalid_category'}),
+        ], return_exceptions=True)
+
+        assert sources['status'] == 'ok'
+        assert isinstance(headlines, ValueError)
+
+    def test_get_many_empty(self, client):
+        """Test get_many with no calls"""
+        assert client.get_many([]) == []
+
     def test_close_session(self, mock_session):
         """Test session close"""
-        mock_session_instance = Mock()
-        mock_session.return_value = mock_session_instance
-
         client = NewsAPIClient()
         client.close()
 
-        mock_session_instance.close.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    def test_get_instance_reuses_client(self):
+        """Test get_instance returns one shared client per key"""
+        NewsAPIClient.invalidate()
+        try:
+            client = NewsAPIClient.get_instance()
+            assert NewsAPIClient.get_instance() is client
+            assert NewsAPIClient.get_instance('test_key_12345678901234567890') is client
+            assert NewsAPIClient.get_instance('other_key_12345678901234567890') is not client
+        finally:
+            NewsAPIClient.invalidate()
+
+    def test_get_instance_after_close(self):
+        """Test a closed client is not handed out again"""
+        NewsAPIClient.invalidate()
+        try:
+            client = NewsAPIClient.get_instance()
+            client.close()
+            assert NewsAPIClient.get_instance() is not client
+        finally:
+            NewsAPIClient.invalidate()
+
+    def test_get_instance_without_key_raises_error(self, monkeypatch):
+        """Test get_instance keeps the missing-key error"""
+        # Don't let a developer's .env supply the key on first construction
+        monkeypatch.setattr(news_api, '_DOTENV_LOADED', True)
+        monkeypatch.delenv('NEWS_API_KEY')
+        with pytest.raises(ValueError, match="NEWS_API_KEY not found"):
+            NewsAPIClient.get_instance()
 
-    @patch('news_api.requests.Session')
-    @patch.dict('os.environ', {'NEWS_API_KEY': 'test_key_12345678901234567890'})
     def test_context_manager(self, mock_session):
         """Test context manager usage"""
-        mock_session_instance = Mock()
-        mock_session.return_value = mock_session_instance
-
         with NewsAPIClient() as client:
             assert client is not None
 
-        mock_session_instance.close.assert_called_once()
+        mock_session.close.assert_called_once()
 
 
 class TestValidateAPIKey:
     """Tests for validate_api_key function"""
 
-    def test_validate_short_key(self):
-        """Test validation with short key"""
-        assert validate_api_key('short') is False
-
-    def test_validate_empty_key(self):
-        """Test validation with empty key"""
-        assert validate_api_key('') is False
-
-    def test_validate_working_key_format(self):
-        """Test validation checks key length"""
-        # This just tests the format validation part
-        # Actual API validation would require a real API key
-        result = validate_api_key('a' * 31)  # Too short
-        assert result is False
-
-        # Note: Full API validation test would require mocking the entire
-        # NewsAPIClient initialization and request flow, which is complex.
-        # The important validation logic (length check) is tested above.
+    @pytest.mark.parametrize("key", ['', 'short', 'a' * 31])
+    def test_validate_rejects_short_key(self, key):
+        """Test keys shorter than 32 characters fail format validation"""
+        assert validate_api_key(key) is False
 
-    @patch('news_api.NewsAPIClient')
+    @patch.object(news_api, 'NewsAPIClient')
     def test_validate_failing_key(self, mock_client):
         """Test validation with failing key"""
         mock_client.side_effect = Exception("Invalid key")
@@ -2,202 +2,344 @@
 Unit tests for ui module
 """
 
+import io
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from ui import NewsUI
+from unittest.mock import Mock, patch
+from rich.console import Console
+import ui
+from ui import NewsUI, _frame_updates
 
 
 class TestNewsUI:
     """Tests for NewsUI class"""
 
-    def test_clear(self):
+    @pytest.fixture(autouse=True)
+    def mock_print(self, monkeypatch):
+        """Silence console output and record print calls"""
+        mock = Mock()
+        monkeypatch.setattr(ui.console, 'print', mock)
+        return mock
+
+    @pytest.fixture(autouse=True)
+    def mock_clear(self, monkeypatch):
+        """Keep tests from clearing the terminal"""
+        mock = Mock()
+        monkeypatch.setattr(ui.console, 'clear', mock)
+        return mock
+
+    def test_clear(self, mock_clear):
         """Test clear console"""
-        with patch('ui.console.clear') as mock_clear:
+        NewsUI.clear()
+        mock_clear.assert_called_once()
+
+    def test_frame_updates_only_changed_rows(self):
+        """Test frame diff rewrites changed rows only"""
+        updates = _frame_updates(['a', 'b', 'c'], ['a', 'x', 'c', 'd'])
+
+        assert '\x1b[2;1Hx' in updates
+        assert '\x1b[4;1Hd' in updates
+        assert '\x1b[1;1H' not in updates
+        assert updates.endswith('\x1b[5;1H\x1b[J')
+
+    def test_frame_repaints_changes(self):
+        """Test first frame is painted in full, later frames incrementally"""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=40, height=30, highlight=False)
+
+        with patch.object(ui, 'console', terminal):
             NewsUI.clear()
-            mock_clear.assert_called_once()
+            with NewsUI.frame():
+                terminal.print('header')
+                terminal.print('page 1')
+            first = terminal.file.getvalue()
+
+            terminal.file.truncate(0)
+            terminal.file.seek(0)
+            with NewsUI.frame():
+                terminal.print('header')
+                terminal.print('page 2')
+            second = terminal.file.getvalue()
+
+        assert 'header' in first and 'page 1' in first
+        assert 'header' not in second
+        assert '\x1b[2;1Hpage 2' in second
+
+    def test_frame_repainted_when_menu_overflows(self, prompt_stub):
+        """Test a frame that leaves too few rows for the menu is painted in full"""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=60, height=12, highlight=False)
+        page_info = {'has_prev': True, 'has_next': True}
+        prompt_stub.return_value = 'n'
+
+        with patch.object(ui, 'console', terminal):
+            reserved = NewsUI.pagination_menu_rows(page_info)
+            rows = terminal.height - reserved + 1
 
-    def test_show_header(self):
+            NewsUI.clear()
+            for _ in range(2):
+                terminal.file.truncate(0)
+                terminal.file.seek(0)
+                with NewsUI.frame(reserved):
+                    for row in range(rows):
+                        terminal.print(f'row {row}')
+                # One row too many: the menu and prompt scroll the terminal
+                NewsUI.show_pagination_menu(page_info)
+            repaint = terminal.file.getvalue()
+
+        assert '\x1b[2J' in repaint
+        assert 'row 0' in repaint
+        assert ui._frame_lines == []
+
+    def test_reset_frame_forces_full_repaint(self):
+        """Test reset_frame makes the next frame a full repaint"""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=40, height=10, highlight=False)
+
+        with patch.object(ui, 'console', terminal):
+            NewsUI.clear()
+            with NewsUI.frame():
+                terminal.print('header')
+                terminal.print('page 1')
+
+            # An action's prompts and messages push the frame off the top
+            for i in range(12):
+                terminal.print(f'message {i}')
+            NewsUI.reset_frame()
+
+            terminal.file.truncate(0)
+            terminal.file.seek(0)
+            with NewsUI.frame():
+                terminal.print('header')
+                terminal.print('page 1')
+            repaint = terminal.file.getvalue()
+
+        assert '\x1b[2J' in repaint
+        assert 'header' in repaint and 'page 1' in repaint
+        assert '\x1b[1;1H' not in repaint.split('\x1b[2J')[-1]
+
+    def test_frame_not_terminal(self):
+        """Test frames are written in full when not attached to a terminal"""
+        plain = Console(file=io.StringIO(), force_terminal=False, width=40)
+
+        with patch.object(ui, 'console', plain):
+            for _ in range(2):
+                with NewsUI.frame():
+                    plain.print('header')
+
+        assert plain.file.getvalue() == 'header\nheader\n'
+
+    def test_frame_legacy_windows(self):
+        """Test legacy Windows consoles print through Rich without row diffs"""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=40, height=30, highlight=False)
+        terminal.legacy_windows = True
+
+        with patch.object(ui, 'console', terminal), patch.object(terminal, 'print', wraps=terminal.print) as printed:
+            for _ in range(2):
+                with NewsUI.frame():
+                    terminal.print('header')
+
+        assert printed.call_count == 2
+        assert terminal.file.getvalue().count('header') == 2
+        assert ';1H' not in terminal.file.getvalue()
+        assert ui._frame_lines == []
+
+    def test_show_header(self, mock_print):
         """Test showing header"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_header()
-            assert mock_print.call_count >= 1
+        NewsUI.show_header()
+        assert mock_print.call_count >= 1
 
-    @patch('ui.Prompt.ask')
-    def test_show_menu(self, mock_ask):
+    def test_show_menu(self, prompt_stub):
         """Test showing menu"""
-        mock_ask.return_value = '1'
+        prompt_stub.return_value = '1'
+
+        choice = NewsUI.show_menu(favorites_count=5)
+        assert choice == '1'
+        prompt_stub.assert_called_once()
+
+    def test_show_menu_reuses_panel(self, prompt_stub, mock_print):
+        """Test the menu panel is rebuilt only when the favorites count changes"""
+        prompt_stub.return_value = '1'
 
-        with patch('ui.console.print'):
-            choice = NewsUI.show_menu(favorites_count=5)
-            assert choice == '1'
-            mock_ask.assert_called_once()
+        NewsUI.show_menu(favorites_count=3)
+        NewsUI.show_menu(favorites_count=3)
+        NewsUI.show_menu(favorites_count=4)
 
-    def test_show_articles_table_empty(self):
+        panels = [call.args[0] for call in mock_print.call_args_list]
+        assert panels[0] is panels[1]
+        assert panels[2] is not panels[0]
+
+    def test_show_articles_table_empty(self, mock_print):
         """Test showing empty articles table"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_articles_table([], {}, show_index=True)
-            # Should show "No articles found" message
+        NewsUI.show_articles_table([], {}, show_index=True)
+        # Should show "No articles found" message
+        mock_print.assert_called_once()
 
-    def test_show_articles_table_with_data(self):
+    def test_show_articles_table_with_data(self, mock_print, sample_article, sample_page_info):
         """Test showing articles table with data"""
-        articles = [
-            {
-                'index': 1,
-                'title': 'Test Article',
-                'source': 'Test Source',
-                'published': '2024-01-15 10:30'
-            }
-        ]
+        NewsUI.show_articles_table([sample_article], sample_page_info)
+        assert mock_print.called
 
-        page_info = {
-            'current_page': 1,
-            'total_pages': 1,
-            'start_index': 1,
-            'end_index': 1,
-            'total_items': 1
-        }
+    def test_show_articles_table_highlighted_title(self, sample_article, sample_page_info):
+        """Test highlight markers render as styled text"""
+        plain = Console(file=io.StringIO(), width=120)
+        article = dict(sample_article, title='Learn [HIGHLIGHT]PYTHON[/HIGHLIGHT] today')
 
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_articles_table(articles, page_info)
-            assert mock_print.called
+        with patch.object(ui, 'console', plain):
+            NewsUI.show_articles_table([article], sample_page_info)
 
-    def test_show_article_detail(self):
-        """Test showing article details"""
-        article = {
-            'title': 'Test Article',
-            'source': 'Test Source',
-            'author': 'John Doe',
-            'published': '2024-01-15 10:30',
-            'description': 'Test description',
-            'url': 'https://test.com'
-        }
+        output = plain.file.getvalue()
+        assert 'Learn PYTHON today' in output
+        assert 'HIGHLIGHT' not in output
 
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_article_detail(article, is_favorite=False)
-            assert mock_print.called
+    def test_show_article_detail(self, mock_print, sample_article):
+        """Test showing article details"""
+        NewsUI.show_article_detail(sample_article, is_favorite=False)
+        assert mock_print.called
 
-    @patch('ui.Prompt.ask')
-    def test_show_categories(self, mock_ask):
+    def test_show_categories(self, prompt_stub):
         """Test showing categories"""
-        mock_ask.return_value = '1'
+        prompt_stub.return_value = '1'
 
-        with patch('ui.console.print'):
-            category = NewsUI.show_categories()
-            assert category == 'business'
+        category = NewsUI.show_categories()
+        assert category == 'business'
 
-    @patch('ui.Prompt.ask')
-    def test_get_search_query(self, mock_ask):
+    def test_get_search_query(self, prompt_stub):
         """Test getting search query"""
-        mock_ask.return_value = 'python'
+        prompt_stub.return_value = 'python'
 
         query = NewsUI.get_search_query()
         assert query == 'python'
 
-    @patch('ui.Prompt.ask')
-    def test_get_search_query_empty(self, mock_ask):
+    def test_get_search_query_empty(self, prompt_stub):
         """Test getting empty search query"""
-        mock_ask.return_value = ''
+        prompt_stub.return_value = ''
 
         query = NewsUI.get_search_query()
         assert query is None
 
-    @patch('ui.Prompt.ask')
-    def test_show_pagination_menu(self, mock_ask):
+    def test_show_pagination_menu(self, prompt_stub):
         """Test showing pagination menu"""
-        mock_ask.return_value = 'n'
+        prompt_stub.return_value = 'n'
 
         page_info = {
             'has_prev': True,
             'has_next': True
         }
 
-        with patch('ui.console.print'):
-            choice = NewsUI.show_pagination_menu(page_info)
-            assert choice == 'n'
-
-    def test_show_success(self):
-        """Test showing success message"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_success("Test success")
-            mock_print.assert_called_once()
-
-    def test_show_error(self):
-        """Test showing error message"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_error("Test error")
-            mock_print.assert_called_once()
-
-    def test_show_warning(self):
-        """Test showing warning message"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_warning("Test warning")
-            mock_print.assert_called_once()
-
-    def test_show_info(self):
-        """Test showing info message"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_info("Test info")
-            mock_print.assert_called_once()
-
-    @patch('ui.Confirm.ask')
-    def test_confirm_true(self, mock_ask):
+        choice = NewsUI.show_pagination_menu(page_info)
+        assert choice == 'n'
+
+    @pytest.mark.parametrize("width,rows", [(60, 7), (80, 6)])
+    def test_pagination_menu_rows_follows_width(self, width, rows):
+        """Test the reserve covers the wrapped panel, prompt and Enter"""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=width, height=40)
+        page_info = {'has_prev': True, 'has_next': True}
+
+        with patch.object(ui, 'console', terminal):
+            assert NewsUI.pagination_menu_rows(page_info) == rows
+
+    @pytest.mark.parametrize("answers,kept", [("n\n", True), ("x\nn\n", False)])
+    def test_menu_reprompt_forgets_frame(self, monkeypatch, answers, kept):
+        """Test an invalid choice makes the next frame a full repaint"""
+        terminal = Console(file=io.StringIO(), force_terminal=True, width=80, height=40)
+        monkeypatch.setattr(ui, '_frame_lines', ['header', 'table'])
+
+        choice = ui._MenuPrompt.ask("Choose action", choices=['n', 'b'],
+                                    console=terminal, stream=io.StringIO(answers))
+
+        assert choice == 'n'
+        assert bool(ui._frame_lines) is kept
+
+    @pytest.mark.parametrize("method,args", [
+        ('show_success', ("Test success",)),
+        ('show_error', ("Test error",)),
+        ('show_warning', ("Test warning",)),
+        ('show_info', ("Test info",)),
+        ('show_goodbye', ()),
+    ])
+    def test_show_message(self, mock_print, method, args):
+        """Test one-line status messages print once"""
+        getattr(NewsUI, method)(*args)
+        mock_print.assert_called_once()
+
+    def test_show_loading_fast_block(self):
+        """Test spinner is never started for a fast block"""
+        loading = NewsUI.show_loading("Fetching", delay=10)
+
+        with patch.object(loading.progress, 'start') as mock_start:
+            with loading:
+                pass
+
+        mock_start.assert_not_called()
+
+    def test_show_loading_slow_block(self):
+        """Test spinner is started and stopped for a slow block"""
+        loading = NewsUI.show_loading("Fetching", delay=0)
+
+        with patch.object(loading.progress, 'start') as mock_start, \
+                patch.object(loading.progress, 'stop') as mock_stop:
+            with loading:
+                loading._timer.join()
+
+        mock_start.assert_called_once()
+        mock_stop.assert_called_once()
+
+    def test_confirm_true(self, confirm_stub):
         """Test confirmation dialog - true"""
-        mock_ask.return_value = True
+        confirm_stub.return_value = True
 
         result = NewsUI.confirm("Are you sure?")
         assert result is True
 
-    @patch('ui.Confirm.ask')
-    def test_confirm_false(self, mock_ask):
+    def test_confirm_false(self, confirm_stub):
         """Test confirmation dialog - false"""
-        mock_ask.return_value = False
+        confirm_stub.return_value = False
 
         result = NewsUI.confirm("Are you sure?")
         assert result is False
 
-    @patch('ui.Prompt.ask')
-    def test_get_number_input_valid(self, mock_ask):
+    def test_get_number_input_valid(self, prompt_stub):
         """Test getting valid number input"""
-        mock_ask.return_value = '5'
+        prompt_stub.return_value = '5'
 
         result = NewsUI.get_number_input("Enter number:", min_val=1, max_val=10)
         assert result == 5
 
-    @patch('ui.Prompt.ask')
-    def test_get_number_input_cancel(self, mock_ask):
+    def test_get_number_input_cancel(self, prompt_stub):
         """Test getting number input - cancel"""
-        mock_ask.return_value = 'q'
+        prompt_stub.return_value = 'q'
 
         result = NewsUI.get_number_input("Enter number:")
         assert result is None
 
-    @patch('ui.webbrowser.open')
-    def test_open_url_success(self, mock_browser):
+    def test_get_number_input_retries_invalid(self, prompt_stub, mock_print):
+        """Test non-numeric and out-of-range answers are asked again"""
+        prompt_stub.side_effect = ['abc', '1.5', '42', ' 7 ']
+
+        result = NewsUI.get_number_input("Enter number:", min_val=1, max_val=10)
+        assert result == 7
+        assert prompt_stub.call_count == 4
+        assert mock_print.call_count == 3
+
+    def test_open_url_success(self, monkeypatch):
         """Test opening URL successfully"""
-        mock_browser.return_value = True
+        calls = []
+        monkeypatch.setattr(ui.webbrowser, 'open', lambda url: calls.append(url) or True)
 
         result = NewsUI.open_url('https://test.com')
         assert result is True
-        mock_browser.assert_called_once_with('https://test.com')
+        assert calls == ['https://test.com']
 
-    @patch('ui.webbrowser.open')
-    def test_open_url_failure(self, mock_browser):
+    def test_open_url_failure(self, monkeypatch):
         """Test opening URL failure"""
-        mock_browser.side_effect = Exception("Failed to open")
+        def failing_open(url):
+            raise Exception("Failed to open")
+
+        monkeypatch.setattr(ui.webbrowser, 'open', failing_open)
 
         result = NewsUI.open_url('https://test.com')
         assert result is False
 
-    @patch('ui.Prompt.ask')
-    def test_press_enter_to_continue(self, mock_ask):
+    def test_press_enter_to_continue(self, prompt_stub):
         """Test press enter to continue"""
-        mock_ask.return_value = ''
+        prompt_stub.return_value = ''
 
         NewsUI.press_enter_to_continue()
-        mock_ask.assert_called_once()
-
-    def test_show_goodbye(self):
-        """Test showing goodbye message"""
-        with patch('ui.console.print') as mock_print:
-            NewsUI.show_goodbye()
-            mock_print.assert_called_once()
+        prompt_stub.assert_called_once()
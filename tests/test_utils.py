@@ -5,6 +5,8 @@ Unit tests for utils module
 import pytest
 import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 from datetime import datetime
 from utils import (
@@ -26,6 +28,25 @@ class TestArticleFormatter:
         assert '2024-01-15' in result
         assert '10:30' in result
 
+    @pytest.mark.parametrize("date_str,expected", [
+        ('2024-01-15T10:30:00.123+05:00', '2024-01-15 10:30'),
+        ('2024-01-15 10:30:00', '2024-01-15 10:30'),
+        ('2024-01-15', '2024-01-15 00:00'),
+    ])
+    def test_format_date_matches_isoformat(self, date_str, expected):
+        """Test sliced and strftime output agree on other ISO shapes"""
+        assert ArticleFormatter.format_date(date_str) == expected
+
+    def test_format_date_cached(self):
+        """Test repeated timestamps reuse the formatted string"""
+        first = ArticleFormatter.format_date(''.join(['2024-01-15', 'T10:30:00Z']))
+        assert ArticleFormatter.format_date('2024-01-15T10:30:00Z') is first
+
+    @pytest.mark.parametrize("date_str", ['2024-13-45T99:99:00Z', '2024-01-15T10:30garbage'])
+    def test_format_date_rejects_invalid_timestamp(self, date_str):
+        """Test well-shaped but invalid timestamps are returned unchanged"""
+        assert ArticleFormatter.format_date(date_str) == date_str
+
     def test_format_date_invalid(self):
         """Test formatting invalid date"""
         result = ArticleFormatter.format_date('invalid_date')
@@ -90,6 +111,22 @@ class TestArticleFormatter:
         assert result['author'] == 'Unknown'
         assert result['description'] == 'N/A'
 
+    def test_format_articles_numbers_from_one(self):
+        """Test bulk formatting keeps order and numbers articles"""
+        articles = [{'title': 'First'}, {'title': 'Second'}]
+        formatted = ArticleFormatter.format_articles(articles)
+
+        assert [(a['index'], a['title']) for a in formatted] == [(1, 'First'), (2, 'Second')]
+        assert ArticleFormatter.format_articles([]) == []
+
+    def test_format_articles_matches_format_article(self):
+        """Test bulk and single formatting produce the same dicts"""
+        articles = [{'title': 'First', 'publishedAt': '2024-01-15T10:30:00Z'}, {'title': 'Second'}]
+        formatted = ArticleFormatter.format_articles(articles, start_index=11)
+
+        assert formatted == [ArticleFormatter.format_article(a, i) for i, a in enumerate(articles, 11)]
+        assert ArticleFormatter.format_articles(articles, start_index=None)[1]['index'] is None
+
     def test_highlight_keywords_basic(self):
         """Test keyword highlighting"""
         text = "Python is a great programming language"
@@ -118,6 +155,27 @@ class TestArticleFormatter:
         result = ArticleFormatter.highlight_keywords(None, ["test"])
         assert result is None
 
+    def test_highlight_keywords_compiled_pattern(self):
+        """Test highlighting with a precompiled pattern"""
+        pattern = ArticleFormatter.compile_keywords(["python", "rust"])
+        result = ArticleFormatter.highlight_keywords("Python beats Rust", pattern)
+        assert result == "[HIGHLIGHT]PYTHON[/HIGHLIGHT] beats [HIGHLIGHT]RUST[/HIGHLIGHT]"
+
+    def test_highlight_keywords_overlapping(self):
+        """Test overlapping keywords are highlighted once"""
+        result = ArticleFormatter.highlight_keywords("Python 3", ["py", "python"])
+        assert result == "[HIGHLIGHT]PYTHON[/HIGHLIGHT] 3"
+
+    def test_compile_keywords_empty(self):
+        """Test compiling an empty keyword list"""
+        assert ArticleFormatter.compile_keywords([]) is None
+        assert ArticleFormatter.compile_keywords(['', '']) is None
+
+    def test_compile_keywords_cached(self):
+        """Test the same keywords reuse one compiled pattern"""
+        first = ArticleFormatter.compile_keywords(["python", "rust"])
+        assert ArticleFormatter.compile_keywords(["python", "rust"]) is first
+
 
 class TestPaginator:
     """Tests for Paginator class"""
@@ -241,6 +299,16 @@ class TestPaginator:
 
         assert page_info['current_page'] == 3
 
+    def test_get_page_empty(self):
+        """Test an empty result has one empty page"""
+        paginator = Paginator([], page_size=10)
+
+        page_items, page_info = paginator.get_page(1)
+
+        assert page_items == []
+        assert page_info['total_pages'] == 0
+        assert page_info['has_next'] is False and page_info['has_prev'] is False
+
 
 class TestFavoritesManager:
     """Tests for FavoritesManager class"""
@@ -248,7 +316,7 @@ class TestFavoritesManager:
     @pytest.fixture
     def temp_favorites_file(self, tmp_path):
         """Create temporary favorites file"""
-        return tmp_path / "test_favorites.json"
+        return tmp_path / "test_favorites.jsonl"
 
     def test_init_new_file(self, temp_favorites_file):
         """Test initialization with non-existent file"""
@@ -329,6 +397,17 @@ class TestFavoritesManager:
         assert result is True
         assert len(manager.favorites) == 0
 
+    def test_remove_favorite_keeps_order(self, temp_favorites_file):
+        """Test removing a favorite keeps the others in saved order"""
+        manager = FavoritesManager(str(temp_favorites_file))
+        for name in ('a', 'b', 'c'):
+            manager.add_favorite({'title': name, 'url': f'https://test.com/{name}'})
+
+        manager.remove_favorite('https://test.com/b')
+
+        assert [fav['title'] for fav in manager.get_favorites()] == ['a', 'c']
+        assert not manager.is_favorite('https://test.com/b')
+
     def test_remove_favorite_nonexistent(self, temp_favorites_file):
         """Test removing non-existent favorite"""
         manager = FavoritesManager(str(temp_favorites_file))
@@ -368,6 +447,14 @@ class TestFavoritesManager:
         assert result is True
         assert len(manager.favorites) == 0
 
+    def test_clear_empty_favorites_writes_nothing(self, temp_favorites_file):
+        """Test clearing an empty list is a no-op on disk"""
+        manager = FavoritesManager(str(temp_favorites_file))
+
+        assert manager.clear_favorites() is True
+        assert manager.flush() is True
+        assert not temp_favorites_file.exists()
+
     def test_is_favorite_true(self, temp_favorites_file):
         """Test checking if article is favorite"""
         manager = FavoritesManager(str(temp_favorites_file))
@@ -381,6 +468,157 @@ class TestFavoritesManager:
         manager.add_favorite(article)
         assert manager.is_favorite('https://test.com') is True
 
+    def test_add_favorite_appends_record(self, temp_favorites_file):
+        """Test each add appends one JSON line"""
+        manager = FavoritesManager(str(temp_favorites_file))
+
+        for i in range(3):
+            manager.add_favorite({'title': f'Test {i}', 'url': f'https://test.com/{i}'})
+        manager.flush()
+
+        lines = temp_favorites_file.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[-1])['url'] == 'https://test.com/2'
+
+    def test_changes_written_on_flush(self, temp_favorites_file):
+        """Test mutations are buffered until flush"""
+        manager = FavoritesManager(str(temp_favorites_file))
+        manager.add_favorite({'title': 'Test', 'url': 'https://test.com'})
+        assert not temp_favorites_file.exists()
+
+        assert manager.flush() is True
+        assert FavoritesManager(str(temp_favorites_file)).is_favorite('https://test.com')
+        assert manager.flush() is True
+
+    def test_failed_rewrite_keeps_file(self, temp_favorites_file, monkeypatch):
+        """Test a failed rewrite leaves the old file and no temp file behind"""
+        manager = FavoritesManager(str(temp_favorites_file))
+        manager.add_favorite({'title': 'Test', 'url': 'https://test.com'})
+        manager.flush()
+        before = temp_favorites_file.read_bytes()
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, 'replace', fail)
+        manager.clear_favorites()
+
+        assert manager.flush() is False
+        assert temp_favorites_file.read_bytes() == before
+        assert list(temp_favorites_file.parent.iterdir()) == [temp_favorites_file]
+
+    def test_add_favorites_batch(self, temp_favorites_file):
+        """Test bulk adds skip duplicates and are written immediately"""
+        manager = FavoritesManager(str(temp_favorites_file))
+        manager.add_favorite({'title': 'Existing', 'url': 'https://test.com/0'})
+
+        added = manager.add_favorites_batch([
+            {'title': f'Test {i}', 'url': f'https://test.com/{i}'} for i in (0, 1, 2, 2)
+        ] + [{'title': 'No URL'}])
+
+        assert added == 2
+        assert len(temp_favorites_file.read_text().splitlines()) == 3
+        assert manager.favorites[1]['saved_at'] == manager.favorites[2]['saved_at']
+
+    def test_remove_favorite_appends_tombstone(self, temp_favorites_file, monkeypatch):
+        """Test removals are persisted as tombstones and replayed on load"""
+        monkeypatch.setattr(FavoritesManager, 'COMPACT_RATIO', 10)
+        manager = FavoritesManager(str(temp_favorites_file))
+
+        for i in range(3):
+            manager.add_favorite({'title': f'Test {i}', 'url': f'https://test.com/{i}'})
+        manager.remove_favorite('https://test.com/1')
+        manager.flush()
+
+        lines = temp_favorites_file.read_text().splitlines()
+        assert json.loads(lines[-1]) == {'url': 'https://test.com/1', 'removed': True}
+
+        reloaded = FavoritesManager(str(temp_favorites_file))
+        assert [fav['url'] for fav in reloaded.favorites] == [
+            'https://test.com/0', 'https://test.com/2'
+        ]
+
+    def test_remove_favorite_compacts_file(self, temp_favorites_file):
+        """Test the file is compacted once dead records pile up"""
+        manager = FavoritesManager(str(temp_favorites_file))
+
+        for i in range(3):
+            manager.add_favorite({'title': f'Test {i}', 'url': f'https://test.com/{i}'})
+        manager.remove_favorite('https://test.com/0')
+        manager.flush()
+
+        lines = temp_favorites_file.read_text().splitlines()
+        assert [json.loads(line)['url'] for line in lines] == [
+            'https://test.com/1', 'https://test.com/2'
+        ]
+
+    def test_favorites_round_trip_unicode(self, temp_favorites_file):
+        """Test non-ASCII favorites survive a save and reload"""
+        manager = FavoritesManager(str(temp_favorites_file))
+        manager.add_favorite({'title': 'Café — 東京', 'url': 'https://test.com/é'})
+        manager.flush()
+
+        reloaded = FavoritesManager(str(temp_favorites_file))
+        assert reloaded.favorites[0]['title'] == 'Café — 東京'
+        assert reloaded.is_favorite('https://test.com/é') is True
+
+    def test_favorites_without_orjson(self, temp_favorites_file):
+        """Test favorites round-trip through the stdlib json fallback"""
+        script = (
+            "import sys; sys.modules['orjson'] = None\n"
+            "from utils import FavoritesManager\n"
+            "manager = FavoritesManager(sys.argv[1])\n"
+            "manager.add_favorite({'title': 'Café', 'url': 'https://test.com'})\n"
+            "manager.flush()\n"
+            "assert FavoritesManager(sys.argv[1]).get_favorites()[0]['title'] == 'Café'\n"
+        )
+        root = Path(__file__).resolve().parent.parent
+        subprocess.run([sys.executable, '-c', script, str(temp_favorites_file)], cwd=root, check=True)
+
+        reloaded = FavoritesManager(str(temp_favorites_file))
+        assert reloaded.is_favorite('https://test.com') is True
+
+    def test_init_skips_corrupted_line(self, temp_favorites_file):
+        """Test a torn line doesn't discard the other favorites"""
+        temp_favorites_file.write_text(
+            json.dumps({'title': 'Test', 'url': 'https://test.com'}) + '\n{"title": "To'
+        )
+
+        manager = FavoritesManager(str(temp_favorites_file))
+        assert manager.get_count() == 1
+
+    def test_legacy_array_file_migrated(self, temp_favorites_file):
+        """Test a JSON array file is rewritten as JSON Lines on next save"""
+        test_data = [{'title': 'Old', 'url': 'https://old.com'}]
+        temp_favorites_file.write_text(json.dumps(test_data, indent=2))
+
+        manager = FavoritesManager(str(temp_favorites_file))
+        manager.add_favorite({'title': 'New', 'url': 'https://new.com'})
+        manager.flush()
+
+        lines = temp_favorites_file.read_text().splitlines()
+        assert [json.loads(line)['url'] for line in lines] == ['https://old.com', 'https://new.com']
+
+    def test_legacy_json_sibling_loaded(self, tmp_path):
+        """Test favorites.json from older versions is picked up"""
+        (tmp_path / 'favorites.json').write_text(
+            json.dumps([{'title': 'Old', 'url': 'https://old.com'}])
+        )
+
+        manager = FavoritesManager(str(tmp_path / 'favorites.jsonl'))
+        assert manager.is_favorite('https://old.com') is True
+
+    def test_is_favorite_loaded_from_file(self, temp_favorites_file):
+        """Test favorites loaded from file are indexed by URL"""
+        test_data = [{'title': 'Test', 'url': 'https://test.com'}]
+        temp_favorites_file.write_text(json.dumps(test_data))
+
+        manager = FavoritesManager(str(temp_favorites_file))
+        assert manager.is_favorite('https://test.com') is True
+
+        manager.remove_favorite('https://test.com')
+        assert manager.is_favorite('https://test.com') is False
+
     def test_is_favorite_false(self, temp_favorites_file):
         """Test checking non-favorite article"""
         manager = FavoritesManager(str(temp_favorites_file))
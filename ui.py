@@ -3,15 +3,17 @@ UI Module
 Sleek terminal interface using rich library
 """
 
-from typing import List, Dict, Optional
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.layout import Layout
 from rich.text import Text
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt, Confirm, InvalidResponse
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
 from rich import box
 from rich.align import Align
 from rich.style import Style
@@ -19,10 +21,92 @@ import webbrowser
 
 console = Console()
 
+# Lines painted by the last NewsUI.frame(), so the next one can skip unchanged rows
+_frame_lines: List[str] = []
+
+# Keyword markers added by ArticleFormatter.highlight_keywords
+_HIGHLIGHT_RE = re.compile(r'\[HIGHLIGHT\](.*?)\[/HIGHLIGHT\]')
+
+# Number prompt answers: an optionally signed integer, or a way to back out
+_INTEGER_RE = re.compile(r'[+-]?\d+')
+_CANCEL_INPUTS = frozenset({'', 'q', 'cancel'})
+
+
+def _frame_updates(previous: List[str], lines: List[str]) -> str:
+    """
+    Build the escape sequences that turn the previous frame into a new one
+
+    Args:
+        previous: Lines currently on screen, starting at the top row
+        lines: Lines to display
+
+    Returns:
+        Control string rewriting only the changed rows
+    """
+    parts = []
+    for row, line in enumerate(lines, 1):
+        if row > len(previous) or previous[row - 1] != line:
+            parts.append(f"\x1b[{row};1H{line}\x1b[K")
+
+    # Park the cursor below the frame and wipe whatever was printed there
+    parts.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+    return ''.join(parts)
+
+
+class _MenuPrompt(Prompt):
+    """Prompt that forgets the last frame when it has to ask again"""
+
+    def on_validate_error(self, value: str, error: InvalidResponse) -> None:
+        # The error and the repeated prompt push the frame up the screen
+        _frame_lines.clear()
+        super().on_validate_error(value, error)
+
+
+class _DelayedProgress:
+    """Progress context manager that only shows up if the block is slow"""
+
+    def __init__(self, progress: Progress, delay: float):
+        """
+        Initialize delayed progress
+
+        Args:
+            progress: Progress display to start
+            delay: Seconds to wait before showing it
+        """
+        self.progress = progress
+        self._timer = threading.Timer(delay, self._start)
+        self._timer.daemon = True
+        self._lock = threading.Lock()
+        self._started = False
+        self._finished = False
+
+    def _start(self):
+        """Show the spinner unless the block already finished"""
+        with self._lock:
+            if self._finished:
+                return
+            self.progress.add_task('', total=None)
+            self.progress.start()
+            self._started = True
+
+    def __enter__(self):
+        self._timer.start()
+        return self.progress
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._timer.cancel()
+        with self._lock:
+            self._finished = True
+            if self._started:
+                self.progress.stop()
+        return False
+
 
 class NewsUI:
     """Sleek UI for News Dashboard"""
 
+    __slots__ = ()
+
     # Color scheme
     COLORS = {
         'primary': '#00d4ff',      # Cyan
@@ -36,41 +120,112 @@ class NewsUI:
         'dim': '#666666',          # Dark gray
     }
 
+    # Bold variant of each colour, built once rather than parsed from a string per call
+    STYLES = {name: Style(color=color, bold=True) for name, color in COLORS.items()}
+
+    # (option, category, description) rows of the category menu
+    CATEGORIES = (
+        ("1", "business", "Business & Finance"),
+        ("2", "entertainment", "Entertainment & Arts"),
+        ("3", "general", "General News"),
+        ("4", "health", "Health & Medicine"),
+        ("5", "science", "Science & Technology"),
+        ("6", "sports", "Sports"),
+        ("7", "technology", "Technology & Innovation"),
+    )
+
+    # Static banners, assembled once and re-rendered by show_header/show_goodbye
+    HEADER = Text.assemble(
+        "\n",
+        ("█▀▀▄ █▀▀ █   █ █▀▀   ", STYLES['primary']),
+        ("█▀▀▄ █▀▀█ █▀▀ █▀▀█\n", STYLES['secondary']),
+        ("█  █ █▀▀ █▄█ ▀▀▀   ", STYLES['primary']),
+        ("█▄▄▀ █  █ ▀▀▀ █  █\n", STYLES['secondary']),
+        ("\nYour Gateway to Global News", f"italic {COLORS['dim']}")
+    )
+    GOODBYE = Text.assemble(
+        ("\n✨ ", COLORS['warning']),
+        ("Thank you for using News Dashboard!", STYLES['primary']),
+        (" ✨\n", COLORS['warning']),
+        ("Stay informed, stay curious!\n", f"italic {COLORS['text']}")
+    )
+
     @staticmethod
     def clear():
         """Clear the console"""
+        _frame_lines.clear()
         console.clear()
 
+    @staticmethod
+    def reset_frame():
+        """Forget the last frame so the next one is painted in full"""
+        _frame_lines.clear()
+
+    @staticmethod
+    @contextmanager
+    def frame(reserved_rows: int = 0):
+        """
+        Paint a full screen, rewriting only the lines that changed
+
+        Output printed inside the block is compared with the previous frame
+        and unchanged rows are left on screen. The first frame after clear()
+        or reset_frame(), non-terminal output and frames that don't leave
+        reserved_rows free below them are painted in full. Legacy Windows
+        consoles, which can't interpret escape codes, always get a cleared
+        screen and a normal print.
+
+        Args:
+            reserved_rows: Rows printed below the frame before the next one,
+                e.g. pagination_menu_rows()
+        """
+        if console.legacy_windows:
+            # Let Rich's Win32 renderer draw; captured text would be raw ANSI
+            _frame_lines.clear()
+            console.clear()
+            yield
+            return
+
+        with console.capture() as capture:
+            yield
+
+        output = capture.get()
+        lines = output.splitlines()
+        fits = len(lines) + reserved_rows <= console.height
+
+        if _frame_lines and fits and console.is_terminal:
+            console.file.write(_frame_updates(_frame_lines, lines))
+        else:
+            console.clear()
+            console.file.write(output)
+        console.file.flush()
+
+        # A frame that scrolled the terminal can't be addressed by row next time
+        _frame_lines[:] = lines if fits else []
+
     @staticmethod
     def show_header():
         """Display application header with sleek design"""
-        header_text = Text()
-        header_text.append("\n")
-        header_text.append("█▀▀▄ █▀▀ █   █ █▀▀   ", style=f"bold {NewsUI.COLORS['primary']}")
-        header_text.append("█▀▀▄ █▀▀█ █▀▀ █▀▀█\n", style=f"bold {NewsUI.COLORS['secondary']}")
-        header_text.append("█  █ █▀▀ █▄█ ▀▀▀   ", style=f"bold {NewsUI.COLORS['primary']}")
-        header_text.append("█▄▄▀ █  █ ▀▀▀ █  █\n", style=f"bold {NewsUI.COLORS['secondary']}")
-        header_text.append("\nYour Gateway to Global News", style=f"italic {NewsUI.COLORS['dim']}")
-
         panel = Panel(
-            Align.center(header_text),
+            Align.center(NewsUI.HEADER),
             box=box.DOUBLE,
             border_style=NewsUI.COLORS['primary'],
             padding=(1, 2)
         )
-        console.print(panel)
-        console.print()
+        with console:  # buffer both prints into one write
+            console.print(panel)
+            console.print()
 
     @staticmethod
-    def show_menu(favorites_count: int = 0) -> str:
+    @lru_cache(maxsize=16)
+    def _menu_panel(favorites_count: int) -> Panel:
         """
-        Display main menu and get user choice
+        Build the main menu panel; it only varies with the favorites count
 
         Args:
             favorites_count: Number of saved favorites
 
         Returns:
-            User's menu choice
+            Panel holding the menu table
         """
         menu_items = [
             ("1", "Top Headlines", "View latest breaking news"),
@@ -83,25 +238,38 @@ class NewsUI:
 
         table = Table(
             show_header=True,
-            header_style=f"bold {NewsUI.COLORS['primary']}",
+            header_style=NewsUI.STYLES['primary'],
             box=box.ROUNDED,
             border_style=NewsUI.COLORS['secondary'],
             padding=(0, 2)
         )
 
-        table.add_column("Option", style=f"bold {NewsUI.COLORS['warning']}", width=8)
-        table.add_column("Action", style=f"bold {NewsUI.COLORS['title']}", width=25)
+        table.add_column("Option", style=NewsUI.STYLES['warning'], width=8)
+        table.add_column("Action", style=NewsUI.STYLES['title'], width=25)
         table.add_column("Description", style=NewsUI.COLORS['text'], width=40)
 
         for option, action, description in menu_items:
             table.add_row(option, action, description)
 
-        console.print(Panel(
+        return Panel(
             table,
             title="[bold]Main Menu[/bold]",
             border_style=NewsUI.COLORS['primary'],
             box=box.DOUBLE
-        ))
+        )
+
+    @staticmethod
+    def show_menu(favorites_count: int = 0) -> str:
+        """
+        Display main menu and get user choice
+
+        Args:
+            favorites_count: Number of saved favorites
+
+        Returns:
+            User's menu choice
+        """
+        console.print(NewsUI._menu_panel(favorites_count))
 
         choice = Prompt.ask(
             "\n[bold cyan]Enter your choice[/bold cyan]",
@@ -126,44 +294,37 @@ class NewsUI:
 
         table = Table(
             show_header=True,
-            header_style=f"bold {NewsUI.COLORS['primary']}",
+            header_style=NewsUI.STYLES['primary'],
             box=box.HEAVY_HEAD,
             border_style=NewsUI.COLORS['secondary'],
             title=f"[bold {NewsUI.COLORS['title']}]Page {page_info['current_page']}/{page_info['total_pages']}[/bold {NewsUI.COLORS['title']}]",
             caption=f"[{NewsUI.COLORS['dim']}]Showing {page_info['start_index']}-{page_info['end_index']} of {page_info['total_items']} articles[/{NewsUI.COLORS['dim']}]",
-            title_style=f"bold {NewsUI.COLORS['info']}",
+            title_style=NewsUI.STYLES['info'],
             caption_style=NewsUI.COLORS['dim']
         )
 
         if show_index:
-            table.add_column("#", style=f"bold {NewsUI.COLORS['warning']}", width=4)
+            table.add_column("#", style=NewsUI.STYLES['warning'], width=4)
 
-        table.add_column("Title", style=f"bold {NewsUI.COLORS['title']}", width=45, no_wrap=False)
+        table.add_column("Title", style=NewsUI.STYLES['title'], width=45, no_wrap=False)
         table.add_column("Source", style=NewsUI.COLORS['info'], width=20)
         table.add_column("Published", style=NewsUI.COLORS['text'], width=16)
 
-        for idx, article in enumerate(articles, 1):
-            row = []
-
-            if show_index:
-                row.append(str(article.get('index', idx)))
-
-            # Highlight title
-            title = article['title']
-            if '[HIGHLIGHT]' in title:
-                title = title.replace('[HIGHLIGHT]', f'[bold {NewsUI.COLORS["warning"]}]')
-                title = title.replace('[/HIGHLIGHT]', '[/bold]')
-
-            row.extend([
-                title,
-                article['source'],
-                article['published']
-            ])
+        warning = NewsUI.COLORS['warning']
+        highlight = f'[bold {warning}]\\1[/bold {warning}]'
+        mark = _HIGHLIGHT_RE.sub
+        rows = [
+            (str(article.get('index', idx)), mark(highlight, article['title']), article['source'], article['published'])
+            for idx, article in enumerate(articles, 1)
+        ]
 
-            table.add_row(*row)
+        add_row = table.add_row
+        for row in rows:
+            add_row(*(row if show_index else row[1:]))
 
-        console.print(table)
-        console.print()
+        with console:  # buffer both prints into one write
+            console.print(table)
+            console.print()
 
     @staticmethod
     def show_article_detail(article: Dict, is_favorite: bool = False):
@@ -176,28 +337,28 @@ class NewsUI:
         """
         # Create detailed content
         content = Text()
-        content.append("Title: ", style=f"bold {NewsUI.COLORS['primary']}")
-        content.append(f"{article['title']}\n\n", style=f"bold {NewsUI.COLORS['title']}")
+        content.append("Title: ", style=NewsUI.STYLES['primary'])
+        content.append(f"{article['title']}\n\n", style=NewsUI.STYLES['title'])
 
-        content.append("Source: ", style=f"bold {NewsUI.COLORS['info']}")
+        content.append("Source: ", style=NewsUI.STYLES['info'])
         content.append(f"{article['source']}\n", style=NewsUI.COLORS['text'])
 
-        content.append("Author: ", style=f"bold {NewsUI.COLORS['info']}")
+        content.append("Author: ", style=NewsUI.STYLES['info'])
         content.append(f"{article.get('author', 'Unknown')}\n", style=NewsUI.COLORS['text'])
 
-        content.append("Published: ", style=f"bold {NewsUI.COLORS['info']}")
+        content.append("Published: ", style=NewsUI.STYLES['info'])
         content.append(f"{article['published']}\n\n", style=NewsUI.COLORS['text'])
 
-        content.append("Description:\n", style=f"bold {NewsUI.COLORS['primary']}")
+        content.append("Description:\n", style=NewsUI.STYLES['primary'])
         content.append(f"{article.get('description', 'No description available')}\n\n", style=NewsUI.COLORS['text'])
 
-        content.append("URL: ", style=f"bold {NewsUI.COLORS['info']}")
+        content.append("URL: ", style=NewsUI.STYLES['info'])
         content.append(f"{article['url']}\n", style=f"link {article['url']} {NewsUI.COLORS['secondary']}")
 
         if is_favorite:
             content.append("\n", style=NewsUI.COLORS['success'])
-            content.append("★ ", style=f"bold {NewsUI.COLORS['warning']}")
-            content.append("Saved in Favorites", style=f"bold {NewsUI.COLORS['success']}")
+            content.append("★ ", style=NewsUI.STYLES['warning'])
+            content.append("Saved in Favorites", style=NewsUI.STYLES['success'])
 
         panel = Panel(
             content,
@@ -207,46 +368,43 @@ class NewsUI:
             padding=(1, 2)
         )
 
-        console.print(panel)
-        console.print()
+        with console:  # buffer both prints into one write
+            console.print(panel)
+            console.print()
 
     @staticmethod
-    def show_categories() -> Optional[str]:
-        """
-        Display category selection menu
-
-        Returns:
-            Selected category or None
-        """
-        categories = [
-            ("1", "business", "Business & Finance"),
-            ("2", "entertainment", "Entertainment & Arts"),
-            ("3", "general", "General News"),
-            ("4", "health", "Health & Medicine"),
-            ("5", "science", "Science & Technology"),
-            ("6", "sports", "Sports"),
-            ("7", "technology", "Technology & Innovation"),
-        ]
-
+    @lru_cache(maxsize=1)
+    def _categories_panel() -> Panel:
+        """Build the category selection panel, which never changes"""
         table = Table(
             show_header=True,
-            header_style=f"bold {NewsUI.COLORS['primary']}",
+            header_style=NewsUI.STYLES['primary'],
             box=box.ROUNDED,
             border_style=NewsUI.COLORS['info']
         )
 
-        table.add_column("Option", style=f"bold {NewsUI.COLORS['warning']}", width=8)
-        table.add_column("Category", style=f"bold {NewsUI.COLORS['title']}", width=20)
+        table.add_column("Option", style=NewsUI.STYLES['warning'], width=8)
+        table.add_column("Category", style=NewsUI.STYLES['title'], width=20)
         table.add_column("Description", style=NewsUI.COLORS['text'], width=30)
 
-        for option, category, description in categories:
+        for option, category, description in NewsUI.CATEGORIES:
             table.add_row(option, category.title(), description)
 
-        console.print(Panel(
+        return Panel(
             table,
             title="[bold]Select Category[/bold]",
             border_style=NewsUI.COLORS['primary']
-        ))
+        )
+
+    @staticmethod
+    def show_categories() -> Optional[str]:
+        """
+        Display category selection menu
+
+        Returns:
+            Selected category or None
+        """
+        console.print(NewsUI._categories_panel())
 
         choice = Prompt.ask(
             "\n[bold cyan]Select category[/bold cyan]",
@@ -254,7 +412,7 @@ class NewsUI:
             default="1"
         )
 
-        return categories[int(choice) - 1][1]
+        return NewsUI.CATEGORIES[int(choice) - 1][1]
 
     @staticmethod
     def get_search_query() -> Optional[str]:
@@ -271,24 +429,26 @@ class NewsUI:
         return query.strip() if query else None
 
     @staticmethod
-    def show_pagination_menu(page_info: Dict) -> str:
+    @lru_cache(maxsize=4)
+    def _pagination_panel(has_prev: bool, has_next: bool) -> Tuple[Panel, List[str]]:
         """
-        Show pagination controls
+        Build the pagination controls for a page's position
 
         Args:
-            page_info: Pagination information
+            has_prev: Whether there is a previous page
+            has_next: Whether there is a next page
 
         Returns:
-            User choice
+            Tuple of (panel, accepted choices)
         """
         options = []
         choices = []
 
-        if page_info['has_prev']:
+        if has_prev:
             options.append(("p", "Previous Page"))
             choices.append("p")
 
-        if page_info['has_next']:
+        if has_next:
             options.append(("n", "Next Page"))
             choices.append("n")
 
@@ -301,9 +461,42 @@ class NewsUI:
         choices.extend(["v", "s", "o", "b"])
 
         menu_text = " | ".join([f"[bold {NewsUI.COLORS['warning']}]{opt}[/bold {NewsUI.COLORS['warning']}]: {desc}" for opt, desc in options])
-        console.print(Panel(menu_text, border_style=NewsUI.COLORS['dim']))
+        return Panel(menu_text, border_style=NewsUI.COLORS['dim']), choices
 
-        return Prompt.ask(
+    @staticmethod
+    def pagination_menu_rows(page_info: Dict) -> int:
+        """
+        Count the rows the pagination menu takes once its prompt is answered
+
+        Args:
+            page_info: Pagination information
+
+        Returns:
+            Rows for the panel, the prompt and the line Enter moves to
+        """
+        panel, choices = NewsUI._pagination_panel(page_info['has_prev'], page_info['has_next'])
+        panel_rows = len(console.render_lines(panel, console.options))
+        prompt_rows = -(-len(f"Choose action [{'/'.join(choices)}]: ") // console.width)
+        return panel_rows + prompt_rows + 1
+
+    @staticmethod
+    def show_pagination_menu(page_info: Dict) -> str:
+        """
+        Show pagination controls
+
+        A mistyped choice is asked again, which scrolls the page above, so
+        the next frame is then painted in full.
+
+        Args:
+            page_info: Pagination information
+
+        Returns:
+            User choice
+        """
+        panel, choices = NewsUI._pagination_panel(page_info['has_prev'], page_info['has_next'])
+        console.print(panel)
+
+        return _MenuPrompt.ask(
             f"[bold {NewsUI.COLORS['primary']}]Choose action[/bold {NewsUI.COLORS['primary']}]",
             choices=choices
         )
@@ -329,22 +522,27 @@ class NewsUI:
         console.print(f"[{NewsUI.COLORS['info']}]ℹ {message}[/{NewsUI.COLORS['info']}]")
 
     @staticmethod
-    def show_loading(message: str = "Loading"):
+    def show_loading(message: str = "Loading", delay: float = 0.1):
         """
         Show loading spinner
 
+        The spinner only appears if the block runs longer than delay, so
+        cached responses don't pay for starting and stopping it.
+
         Args:
             message: Loading message
+            delay: Seconds to wait before showing the spinner
 
         Returns:
             Progress context manager
         """
-        return Progress(
+        progress = Progress(
             SpinnerColumn(style=NewsUI.COLORS['primary']),
             TextColumn(f"[bold {NewsUI.COLORS['info']}]{message}...[/bold {NewsUI.COLORS['info']}]"),
             transient=True,
             console=console
         )
+        return _DelayedProgress(progress, delay)
 
     @staticmethod
     def confirm(message: str, default: bool = False) -> bool:
@@ -376,27 +574,28 @@ class NewsUI:
         Returns:
             Number or None
         """
+        styled_prompt = f"[bold {NewsUI.COLORS['primary']}]{prompt}[/bold {NewsUI.COLORS['primary']}]"
         while True:
-            try:
-                response = Prompt.ask(f"[bold {NewsUI.COLORS['primary']}]{prompt}[/bold {NewsUI.COLORS['primary']}]")
+            response = (Prompt.ask(styled_prompt) or '').strip()
 
-                if not response or response.lower() in ['q', 'cancel']:
-                    return None
+            if response.lower() in _CANCEL_INPUTS:
+                return None
 
-                value = int(response)
+            if not _INTEGER_RE.fullmatch(response):
+                NewsUI.show_error("Please enter a valid number")
+                continue
 
-                if value < min_val:
-                    NewsUI.show_error(f"Value must be at least {min_val}")
-                    continue
+            value = int(response)
 
-                if max_val and value > max_val:
-                    NewsUI.show_error(f"Value must be at most {max_val}")
-                    continue
+            if value < min_val:
+                NewsUI.show_error(f"Value must be at least {min_val}")
+                continue
 
-                return value
+            if max_val and value > max_val:
+                NewsUI.show_error(f"Value must be at most {max_val}")
+                continue
 
-            except ValueError:
-                NewsUI.show_error("Please enter a valid number")
+            return value
 
     @staticmethod
     def open_url(url: str) -> bool:
@@ -423,14 +622,8 @@ class NewsUI:
     @staticmethod
     def show_goodbye():
         """Display goodbye message"""
-        goodbye_text = Text()
-        goodbye_text.append("\n✨ ", style=NewsUI.COLORS['warning'])
-        goodbye_text.append("Thank you for using News Dashboard!", style=f"bold {NewsUI.COLORS['primary']}")
-        goodbye_text.append(" ✨\n", style=NewsUI.COLORS['warning'])
-        goodbye_text.append("Stay informed, stay curious!\n", style=f"italic {NewsUI.COLORS['text']}")
-
         panel = Panel(
-            Align.center(goodbye_text),
+            Align.center(NewsUI.GOODBYE),
             border_style=NewsUI.COLORS['secondary'],
             box=box.DOUBLE
         )
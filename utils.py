@@ -3,16 +3,65 @@ Utility Module
 Helper functions for formatting, pagination, and data management
 """
 
-import json
 import os
+import re
+import atexit
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from itertools import count, repeat
+from typing import List, Dict, Iterable, Tuple, Optional, Pattern, Union
 from pathlib import Path
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize like orjson: compact, UTF-8 encoded bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def _mark_highlight(match: re.Match) -> str:
+    """Wrap a keyword match in highlight markers"""
+    return f'[HIGHLIGHT]{match.group(0).upper()}[/HIGHLIGHT]'
+
+
+@lru_cache(maxsize=256)
+def _compile_keywords(keywords: Tuple[str, ...]) -> Optional[Pattern]:
+    """Compile a keyword tuple once; see ArticleFormatter.compile_keywords"""
+    keywords = [keyword for keyword in keywords if keyword]
+    if not keywords:
+        return None
+
+    # Longest first so a keyword isn't shadowed by one of its prefixes
+    keywords.sort(key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _format_date(date_str: Optional[str]) -> str:
+    """Format one timestamp once; see ArticleFormatter.format_date"""
+    try:
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return date_str or 'N/A'
+
+    # Every field is validated by now; for the usual fixed-width
+    # YYYY-MM-DDTHH:MM... the result is a slice, which beats strftime
+    if (len(date_str) >= 16 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[10] in 'T ' and date_str[13] == ':' and dt.year >= 1000):
+        return f"{date_str[:10]} {date_str[11:16]}"
+    return dt.strftime('%Y-%m-%d %H:%M')
+
 
 class ArticleFormatter:
     """Format news articles for display"""
 
+    __slots__ = ()
+
     @staticmethod
     def format_date(date_str: str) -> str:
         """
@@ -24,11 +73,7 @@ class ArticleFormatter:
         Returns:
             Formatted date string
         """
-        try:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M')
-        except (ValueError, AttributeError):
-            return date_str or 'N/A'
+        return _format_date(date_str)
 
     @staticmethod
     def truncate_text(text: str, max_length: int = 100) -> str:
@@ -63,26 +108,58 @@ class ArticleFormatter:
         Returns:
             Formatted article dictionary
         """
-        formatted = {
-            'index': index,
-            'title': article.get('title', 'No Title'),
-            'source': article.get('source', {}).get('name', 'Unknown Source'),
-            'author': article.get('author', 'Unknown'),
-            'description': ArticleFormatter.truncate_text(article.get('description', ''), 150),
-            'url': article.get('url', ''),
-            'published': ArticleFormatter.format_date(article.get('publishedAt', '')),
-            'content': article.get('content', 'No content available')
-        }
-        return formatted
+        return ArticleFormatter.format_articles([article], index)[0]
+
+    @staticmethod
+    def format_articles(articles: List[Dict], start_index: Optional[int] = 1) -> List[Dict]:
+        """
+        Format a list of articles, numbering them consecutively
+
+        Args:
+            articles: Raw article dictionaries from API
+            start_index: Index of the first article (None leaves them unnumbered)
+
+        Returns:
+            Formatted article dictionaries
+        """
+        truncate = ArticleFormatter.truncate_text
+        indexes = repeat(None) if start_index is None else count(start_index)
+        return [
+            {
+                'index': index,
+                'title': article.get('title', 'No Title'),
+                'source': article.get('source', {}).get('name', 'Unknown Source'),
+                'author': article.get('author', 'Unknown'),
+                'description': truncate(article.get('description', ''), 150),
+                'url': article.get('url', ''),
+                'published': _format_date(article.get('publishedAt', '')),
+                'content': article.get('content', 'No content available')
+            }
+            for index, article in zip(indexes, articles)
+        ]
 
     @staticmethod
-    def highlight_keywords(text: str, keywords: List[str]) -> str:
+    def compile_keywords(keywords: List[str]) -> Optional[Pattern]:
+        """
+        Compile keywords into a single case-insensitive pattern
+
+        Args:
+            keywords: List of keywords to match
+
+        Returns:
+            Compiled pattern, or None if there are no keywords
+        """
+        return _compile_keywords(tuple(keywords))
+
+    @staticmethod
+    def highlight_keywords(text: str, keywords: Union[List[str], Pattern]) -> str:
         """
         Highlight keywords in text (returns text with markers)
 
         Args:
             text: Text to process
-            keywords: List of keywords to highlight
+            keywords: List of keywords to highlight, or a pattern from
+                compile_keywords() when highlighting many texts
 
         Returns:
             Text with highlight markers
@@ -90,20 +167,21 @@ class ArticleFormatter:
         if not keywords or not text:
             return text
 
-        result = text
-        for keyword in keywords:
-            if keyword:
-                # Case-insensitive replacement
-                import re
-                pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                result = pattern.sub(f'[HIGHLIGHT]{keyword.upper()}[/HIGHLIGHT]', result)
+        if isinstance(keywords, re.Pattern):
+            pattern = keywords
+        else:
+            pattern = ArticleFormatter.compile_keywords(keywords)
+            if pattern is None:
+                return text
 
-        return result
+        return pattern.sub(_mark_highlight, text)
 
 
 class Paginator:
     """Handle pagination of results"""
 
+    __slots__ = ('items', 'page_size', 'total_items', 'total_pages', 'current_page', '_pages', '_page_infos')
+
     def __init__(self, items: List, page_size: int = 10):
         """
         Initialize paginator
@@ -118,6 +196,27 @@ class Paginator:
         self.total_pages = (self.total_items + self.page_size - 1) // self.page_size
         self.current_page = 1
 
+        # Slice and describe every page once up front so page flips are a
+        # list lookup; an empty result still has one (empty) page to show
+        page_count = self.total_pages or 1
+        self._pages = [
+            items[start:start + self.page_size]
+            for start in range(0, page_count * self.page_size, self.page_size)
+        ]
+        self._page_infos = [
+            {
+                'current_page': page,
+                'total_pages': self.total_pages,
+                'page_size': self.page_size,
+                'total_items': self.total_items,
+                'start_index': (page - 1) * self.page_size + 1,
+                'end_index': min(page * self.page_size, self.total_items),
+                'has_next': page < self.total_pages,
+                'has_prev': page > 1
+            }
+            for page in range(1, page_count + 1)
+        ]
+
     def get_page(self, page_number: int) -> Tuple[List, Dict]:
         """
         Get items for a specific page
@@ -126,28 +225,12 @@ class Paginator:
             page_number: Page number (1-indexed)
 
         Returns:
-            Tuple of (items_on_page, page_info)
+            Tuple of (items_on_page, page_info); page_info is shared between
+            calls and must not be modified
         """
         page_number = max(1, min(page_number, self.total_pages or 1))
         self.current_page = page_number
-
-        start_idx = (page_number - 1) * self.page_size
-        end_idx = start_idx + self.page_size
-
-        items_on_page = self.items[start_idx:end_idx]
-
-        page_info = {
-            'current_page': page_number,
-            'total_pages': self.total_pages,
-            'page_size': self.page_size,
-            'total_items': self.total_items,
-            'start_index': start_idx + 1,
-            'end_index': min(end_idx, self.total_items),
-            'has_next': page_number < self.total_pages,
-            'has_prev': page_number > 1
-        }
-
-        return items_on_page, page_info
+        return self._pages[page_number - 1], self._page_infos[page_number - 1]
 
     def next_page(self) -> Tuple[List, Dict]:
         """Get next page"""
@@ -167,49 +250,169 @@ class Paginator:
 
 
 class FavoritesManager:
-    """Manage favorite articles"""
+    """
+    Manage favorite articles
+
+    Favorites are stored as JSON Lines: adding appends one record and removing
+    appends a tombstone, so a save never rewrites the whole file. The file is
+    compacted once superseded records outnumber COMPACT_RATIO of the live ones.
 
-    def __init__(self, file_path: str = 'favorites.json'):
+    Changes are buffered in memory and written by flush(), which also runs at
+    interpreter exit.
+    """
+
+    COMPACT_RATIO = 0.25
+
+    __slots__ = ('file_path', '_dead', '_needs_rewrite', '_pending', '_by_url')
+
+    def __init__(self, file_path: str = 'favorites.jsonl'):
         """
         Initialize favorites manager
 
         Args:
-            file_path: Path to favorites JSON file
+            file_path: Path to favorites JSON Lines file
         """
         self.file_path = Path(file_path)
-        self.favorites = self._load_favorites()
+        self._dead = 0               # superseded records in the file
+        self._needs_rewrite = False  # file must be rewritten rather than appended to
+        self._pending: List[Dict] = []  # records not yet appended to the file
+        self._by_url = self._load_favorites()  # insertion-ordered, so oldest first
+        atexit.register(self.flush)
+
+    @property
+    def favorites(self) -> List[Dict]:
+        """Favorites in the order they were saved"""
+        return list(self._by_url.values())
+
+    def _load_favorites(self) -> Dict[str, Dict]:
+        """Load favorites from file keyed by URL, replaying removals"""
+        path = self.file_path
+        if not path.exists():
+            # Migrate favorites.json written by older versions
+            legacy_path = path.with_suffix('.json')
+            if path.suffix != '.jsonl' or not legacy_path.exists():
+                return {}
+            path = legacy_path
+            self._needs_rewrite = True
 
-    def _load_favorites(self) -> List[Dict]:
-        """Load favorites from file"""
-        if not self.file_path.exists():
-            return []
+        try:
+            with open(path, 'rb') as f:
+                if f.peek().lstrip().startswith(b'['):
+                    # Older versions saved a single JSON array
+                    self._needs_rewrite = True
+                    try:
+                        return {fav.get('url'): fav for fav in _json_loads(f.read()) if isinstance(fav, dict)}
+                    except ValueError:
+                        return {}
+
+                # Replay line by line so only one record is held as raw bytes
+                return self._replay_records(f)
+        except IOError:
+            return {}
+
+    def _replay_records(self, lines: Iterable[bytes]) -> Dict[str, Dict]:
+        """
+        Apply JSON Lines records in order, counting superseded ones
+
+        Args:
+            lines: Raw lines of the favorites file
+
+        Returns:
+            Live favorites keyed by URL
+        """
+        by_url = {}
+        for line in lines:
+            if not line.strip():
+                continue
+
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                # Skip a torn or corrupted line rather than losing the file
+                self._dead += 1
+                continue
+
+            if not isinstance(record, dict):
+                self._dead += 1
+                continue
+
+            url = record.get('url')
+            if record.get('removed'):
+                if by_url.pop(url, None) is not None:
+                    self._dead += 1
+                self._dead += 1
+            else:
+                if url in by_url:
+                    self._dead += 1
+                    del by_url[url]
+                by_url[url] = record
+
+        return by_url
+
+    def _append_record(self, record: Dict):
+        """
+        Queue one record to be appended on the next flush
+
+        Args:
+            record: Favorite or tombstone to append
+        """
+        if not self._needs_rewrite:
+            self._pending.append(record)
+
+    def _save_favorites(self):
+        """Schedule a rewrite of the file with only the live favorites"""
+        self._needs_rewrite = True
+        self._pending.clear()
+
+    def flush(self) -> bool:
+        """
+        Write buffered changes to the favorites file
+
+        Returns:
+            True if successful (or nothing to write), False otherwise
+        """
+        if self._needs_rewrite:
+            return self._rewrite()
+        if not self._pending:
+            return True
 
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
+            with open(self.file_path, 'ab') as f:
+                f.write(b''.join(_json_dumps(record) + b'\n' for record in self._pending))
+        except IOError:
+            return False
 
-    def _save_favorites(self) -> bool:
+        self._pending.clear()
+        return True
+
+    def _rewrite(self) -> bool:
         """
-        Save favorites to file
+        Replace the file with only the live favorites
 
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = self.file_path.with_name(self.file_path.name + '.tmp')
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.favorites, f, indent=2, ensure_ascii=False)
-            return True
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(_json_dumps(fav) + b'\n' for fav in self._by_url.values()))
+            os.replace(tmp_path, self.file_path)
         except IOError:
+            # Leave the old file intact and don't strand a half-written copy
+            tmp_path.unlink(missing_ok=True)
             return False
 
-    def add_favorite(self, article: Dict) -> bool:
+        self._dead = 0
+        self._needs_rewrite = False
+        return True
+
+    def add_favorite(self, article: Dict, saved_at: Optional[str] = None) -> bool:
         """
         Add article to favorites
 
         Args:
             article: Article dictionary
+            saved_at: ISO timestamp to record (defaults to now)
 
         Returns:
             True if added, False if already exists
@@ -219,7 +422,7 @@ class FavoritesManager:
             return False
 
         # Check if already exists
-        if any(fav.get('url') == url for fav in self.favorites):
+        if url in self._by_url:
             return False
 
         favorite = {
@@ -228,13 +431,29 @@ class FavoritesManager:
             'url': url,
             'description': article.get('description', ''),
             'published': article.get('publishedAt', ''),
-            'saved_at': datetime.now().isoformat()
+            'saved_at': saved_at or datetime.now().isoformat()
         }
 
-        self.favorites.append(favorite)
-        self._save_favorites()
+        self._by_url[url] = favorite
+        self._append_record(favorite)
         return True
 
+    def add_favorites_batch(self, articles: List[Dict]) -> int:
+        """
+        Add several articles and write them to the file in one go
+
+        Args:
+            articles: Article dictionaries
+
+        Returns:
+            Number of articles added (duplicates and URL-less ones are skipped)
+        """
+        saved_at = datetime.now().isoformat()
+        added = sum(self.add_favorite(article, saved_at) for article in articles)
+        if added:
+            self.flush()
+        return added
+
     def remove_favorite(self, url: str) -> bool:
         """
         Remove article from favorites by URL
@@ -245,17 +464,20 @@ class FavoritesManager:
         Returns:
             True if removed, False if not found
         """
-        original_length = len(self.favorites)
-        self.favorites = [fav for fav in self.favorites if fav.get('url') != url]
+        if self._by_url.pop(url, None) is None:
+            return False
 
-        if len(self.favorites) < original_length:
+        # The removed record and its tombstone are both dead weight now
+        self._dead += 2
+        if self._dead > len(self._by_url) * self.COMPACT_RATIO:
             self._save_favorites()
-            return True
-        return False
+        else:
+            self._append_record({'url': url, 'removed': True})
+        return True
 
     def get_favorites(self) -> List[Dict]:
         """Get all favorites"""
-        return self.favorites.copy()
+        return self.favorites
 
     def clear_favorites(self) -> bool:
         """
@@ -264,8 +486,10 @@ class FavoritesManager:
         Returns:
             True if successful
         """
-        self.favorites = []
-        return self._save_favorites()
+        if self._by_url:
+            self._by_url.clear()
+            self._save_favorites()
+        return True
 
     def is_favorite(self, url: str) -> bool:
         """
@@ -277,11 +501,11 @@ class FavoritesManager:
         Returns:
             True if in favorites
         """
-        return any(fav.get('url') == url for fav in self.favorites)
+        return url in self._by_url
 
     def get_count(self) -> int:
         """Get number of favorites"""
-        return len(self.favorites)
+        return len(self._by_url)
 
 
 def validate_input(prompt: str, valid_options: List[str], allow_empty: bool = False) -> str:
@@ -296,16 +520,18 @@ def validate_input(prompt: str, valid_options: List[str], allow_empty: bool = Fa
     Returns:
         Validated input
     """
+    options = frozenset(valid_options)
+    error = f"Invalid input. Please choose from: {', '.join(valid_options)}"
     while True:
         user_input = input(prompt).strip()
 
         if allow_empty and not user_input:
             return user_input
 
-        if user_input in valid_options:
+        if user_input in options:
             return user_input
 
-        print(f"Invalid input. Please choose from: {', '.join(valid_options)}")
+        print(error)
 
 
 def get_integer_input(prompt: str, min_val: int = 1, max_val: Optional[int] = None) -> Optional[int]: